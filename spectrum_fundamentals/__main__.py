@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 """Command-line interface."""
 import click
-from rich import traceback
 
 
 @click.command()
@@ -11,5 +10,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    from rich import traceback  # imported here, since it is only needed when run as a script
+
     traceback.install()
     main(prog_name="spectrum_fundamentals")  # pragma: no cover
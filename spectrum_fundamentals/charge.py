@@ -1,35 +1,107 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+import scipy.sparse
 
 
-def indices_to_one_hot(labels: Union[int, List[int], np.ndarray], classes: Optional[int] = None) -> np.ndarray:
+def _get_classes(max_label: int, classes: Optional[int]) -> int:
+    """
+    Get the number of classes and check that it is large enough for the highest label.
+
+    :param max_label: The highest one-based label
+    :param classes: The number of classes. If None, set to max_label.
+    :raises ValueError: If max_label is larger than the number of classes.
+    :return: the number of classes
+    """
+    if classes is None:
+        classes = max_label
+    if max_label > classes:
+        raise ValueError(
+            f"All labels must be smaller or equal to the number of classes. max_label: {max_label}, classes: {classes}"
+        )
+    return classes
+
+
+def _get_zeroed_buffer(out: Optional[np.ndarray], shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Get a buffer of zeros with the given shape, reusing out if provided.
+
+    :param out: Optional preallocated array
+    :param shape: The expected shape of the buffer
+    :raises ValueError: If out does not have the expected shape.
+    :return: out filled with zeros or a new uint8 array of zeros
+    """
+    if out is None:
+        return np.zeros(shape, dtype=np.uint8)
+    if out.shape != shape:
+        raise ValueError(f"Shape of out must be {shape}. Given: {out.shape}")
+    out.fill(0)
+    return out
+
+
+def _sparse_one_hot(labels: np.ndarray, classes: int) -> scipy.sparse.csr_matrix:
+    """
+    Create a sparse one-hot encoding with a single stored entry per row.
+
+    :param labels: The one-based labels
+    :param classes: The number of classes
+    :return: scipy.sparse.csr_matrix of shape (number of labels, classes) with the one-hot encoded labels.
+    """
+    data = np.ones(labels.size, dtype=np.uint8)
+    indptr = np.arange(labels.size + 1)
+    return scipy.sparse.csr_matrix((data, labels - 1, indptr), shape=(labels.size, classes))
+
+
+def indices_to_one_hot(
+    labels: Union[int, List[int], np.ndarray],
+    classes: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    sparse: bool = False,
+) -> Union[np.ndarray, scipy.sparse.csr_matrix]:
     """
     Convert a single or a list of labels to one-hot encoding.
 
     :param labels: The labels to be one-hot encoding. Must be one-based.
     :param classes: The number of classes, i.e. the length of the encoding. If omitted, set to the max label + 1.
+    :param out: Optional preallocated array of shape (number of labels, classes) the encoding is written to.
+        This allows to reuse the same buffer when encoding many batches of labels.
+    :param sparse: If True, return a scipy.sparse.csr_matrix, which only stores one entry per label instead of
+        a dense matrix. Useful for large numbers of classes.
     :raises TypeError: If the type of labels is not understood
-    :raises ValueError: If the highest label in labels is larger or equal to the number of classes.
-    :return: np.ndarray with the one-hot encoded labels.
+    :raises ValueError: If the highest label in labels is larger than the number of classes.
+    :raises ValueError: If out does not have the shape (number of labels, classes).
+    :raises ValueError: If out is provided together with sparse=True
+    :return: np.ndarray of dtype uint8 with the one-hot encoded labels, or out if it was provided, or
+        scipy.sparse.csr_matrix if sparse is True.
     """
+    if sparse and out is not None:
+        raise ValueError("A preallocated out array cannot be used for a sparse encoding.")
+
+    if isinstance(labels, int) and not sparse:
+        # a single label is a single row, no need for any array conversion or fancy indexing
+        classes = _get_classes(labels, classes)
+        one_hot = _get_zeroed_buffer(out, (1, classes))
+        one_hot[0, labels - 1] = 1
+        return one_hot
+
     if isinstance(labels, int):
-        labels = np.array([labels])
-    elif isinstance(labels, (list, np.ndarray)):
-        labels = np.array(labels)
-    else:
+        labels = [labels]
+    elif not isinstance(labels, (list, np.ndarray)):
         raise TypeError(
             f"Type of labels not understood. Only int, List[int] and np.ndarray are supported. Given: {type(labels)}."
         )
 
-    max_label = int(labels.max())
-    if classes is None:
-        classes = max_label
-    if max_label > classes:
-        raise ValueError(
-            f"All labels must be smaller or equal to the number of classes. max_label: {max_label}, classes: {classes}"
-        )
+    labels = np.asarray(labels, dtype=np.intp).ravel()
+    classes = _get_classes(int(labels.max()), classes)
+
+    if sparse:
+        return _sparse_one_hot(labels, classes)
+
+    if out is None and classes <= labels.size:
+        # gather the rows of an identity matrix instead of allocating zeros and scattering the ones. The identity
+        # matrix has classes x classes entries, so this is only done if it is not larger than the result itself
+        return np.eye(classes, dtype=np.uint8)[labels - 1]
 
-    one_hot = np.zeros((labels.size, classes), dtype=int)
+    one_hot = _get_zeroed_buffer(out, (labels.size, classes))
     one_hot[np.arange(labels.size), labels - 1] = 1
     return one_hot
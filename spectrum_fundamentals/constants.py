@@ -1,6 +1,29 @@
 from enum import Enum
+from typing import Any, Dict, List, NoReturn, Tuple
+
+
+class _ReadOnlyDict(dict):
+    """
+    Dictionary that cannot be modified in place, used for the merged lookup tables.
+
+    Lookups are those of the builtin dict. Unlike a MappingProxyType view it can be pickled and deep-copied, e.g. to
+    pass a table to joblib or multiprocessing workers. copy() and unpacking into a new dict return modifiable
+    plain dicts.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__!r} object does not support item assignment")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[Any, Any]]]:
+        """
+        Rebuild the table from a plain dict when unpickling or copying, since setting the items is not possible.
+
+        :return: the class and the items of the table as plain dict
+        """
+        return type(self), (dict(self),)
 
-import numpy as np
 
 #####################
 # GENERAL CONSTANTS #
@@ -71,7 +94,8 @@ ALPHABET_MODS = {
     "R[UNIMOD:267]": 15,
 }
 
-ALPHABET = {**AA_ALPHABET, **ALPHABET_MODS, **TERMINAL_ALPHABET}
+# the merged lookup tables are read-only, use {**TABLE, ...} or TABLE.copy() to derive modified tables
+ALPHABET = _ReadOnlyDict({**AA_ALPHABET, **ALPHABET_MODS, **TERMINAL_ALPHABET})
 
 ######################
 # MaxQuant constants #
@@ -149,89 +173,93 @@ MASSES["N_TERMINUS"] = MASSES["H"]
 MASSES["C_TERMINUS"] = MASSES["O"] + MASSES["H"]
 
 
-AA_MASSES = {
-    "A": 71.037114,
-    "R": 156.101111,
-    "N": 114.042927,
-    "D": 115.026943,
-    "C": 103.009185,
-    "E": 129.042593,
-    "Q": 128.058578,
-    "G": 57.021464,
-    "H": 137.058912,
-    "I": 113.084064,
-    "L": 113.084064,
-    "K": 128.094963,
-    "M": 131.040485,
-    "F": 147.068414,
-    "P": 97.052764,
-    "S": 87.032028,
-    "T": 101.047679,
-    "U": 150.95363,
-    "W": 186.079313,
-    "Y": 163.063329,
-    "V": 99.068414,
-    "[]-": MASSES["N_TERMINUS"],
-    "-[]": MASSES["C_TERMINUS"],
-}
-
-MOD_MASSES = {
-    "[UNIMOD:737]": 229.162932,  # TMT_6
-    "[UNIMOD:2016]": 304.207146,  # TMT_PRO
-    "[UNIMOD:214]": 144.102063,  # iTRAQ4
-    "[UNIMOD:730]": 304.205360,  # iTRAQ8
-    "[UNIMOD:259]": 8.014199,  # SILAC Lysine
-    "[UNIMOD:267]": 10.008269,  # SILAC Arginine
-    "[]": 0.0,
-    "[UNIMOD:1]": 42.010565,  # Acetylation
-    "[UNIMOD:1896]": 158.003765,  # DSSO-crosslinker
-    "[UNIMOD:1881]": 54.010565,  # Alkene short fragment of DSSO-crosslinker
-    "[UNIMOD:1882]": 85.982635,  # Thiol long fragment of DSSO-crosslinker
-    "[UNIMOD:1884]": 196.084792,  # BuUrBu (DSBU)-crosslinker
-    "[UNIMOD:1885]": 111.032028,  # BuUr long fragment of BuUrBu (DSBU)-crosslinker
-    "[UNIMOD:1886]": 85.052764,  # Bu short fragment of BuUrBu (DSBU)-crosslinker
-    "[UNIMOD:1898]": 138.068080,  # DSS and BS3 non-cleavable crosslinker
-    "[UNIMOD:122]": 27.994915,  # Formylation
-    "[UNIMOD:1289]": 70.041865,  # Butyrylation
-    "[UNIMOD:1363]": 68.026215,  # Crotonylation
-    "[UNIMOD:1848]": 114.031694,  # Glutarylation
-    "[UNIMOD:1914]": -32.008456,  # Oxidation and then loss of oxidized M side chain
-    "[UNIMOD:2]": -0.984016,  # Amidation
-    "[UNIMOD:21]": 79.966331,  # Phosphorylation
-    "[UNIMOD:213]": 541.06111,  # ADP-ribosylation
-    "[UNIMOD:23]": -18.010565,  # Water Loss
-    "[UNIMOD:24]": 71.037114,  # Propionamidation
-    "[UNIMOD:354]": 44.985078,  # Nitrosylation
-    "[UNIMOD:28]": -17.026549,  # Glu to PyroGlu
-    "[UNIMOD:280]": 28.0313,  # Ethylation
-    "[UNIMOD:299]": 43.989829,  # Carboxylation
-    "[UNIMOD:3]": 226.077598,  # Biotinylation
-    "[UNIMOD:34]": 14.01565,  # Methylation
-    "[UNIMOD:345]": 47.984744,  # Trioxidation
-    "[UNIMOD:35]": 15.994915,  # Hydroxylation
-    "[UNIMOD:351]": 3.994915,  # Oxidation to Kynurenine
-    "[UNIMOD:36]": 28.0313,  # Dimethylation
-    "[UNIMOD:360]": -30.010565,  # Pyrrolidinone
-    "[UNIMOD:368]": -33.987721,  # Dehydroalanine
-    "[UNIMOD:37]": 42.04695,  # Trimethylation
-    "[UNIMOD:385]": -17.026549,  # Ammonia loss
-    "[UNIMOD:392]": 29.974179,  # Quinone
-    "[UNIMOD:4]": 57.021464,  # Carbamidomethyl
-    "[UNIMOD:40]": 79.956815,  # Sulfonation
-    "[UNIMOD:401]": -2.01565,  # Didehydro
-    "[UNIMOD:425]": 31.989829,  # Dioxidation
-    "[UNIMOD:43]": 203.079373,  # HexNAc
-    "[UNIMOD:44]": 204.187801,  # Farnesylation
-    "[UNIMOD:447]": -15.994915,  # Reduction
-    "[UNIMOD:46]": 229.014009,  # Pyridoxal phosphate
-    "[UNIMOD:47]": 238.229666,  # Palmitoylation
-    "[UNIMOD:5]": 43.005814,  # Carbamyl
-    "[UNIMOD:58]": 56.026215,  # Propionylation
-    "[UNIMOD:6]": 58.005479,  # Carboxymethylation
-    "[UNIMOD:64]": 100.016044,  # Succinylation
-    "[UNIMOD:7]": 0.984016,  # Deamidation
-    "[UNIMOD:747]": 86.000394,  # Malonylation
-}
+AA_MASSES = _ReadOnlyDict(
+    {
+        "A": 71.037114,
+        "R": 156.101111,
+        "N": 114.042927,
+        "D": 115.026943,
+        "C": 103.009185,
+        "E": 129.042593,
+        "Q": 128.058578,
+        "G": 57.021464,
+        "H": 137.058912,
+        "I": 113.084064,
+        "L": 113.084064,
+        "K": 128.094963,
+        "M": 131.040485,
+        "F": 147.068414,
+        "P": 97.052764,
+        "S": 87.032028,
+        "T": 101.047679,
+        "U": 150.95363,
+        "W": 186.079313,
+        "Y": 163.063329,
+        "V": 99.068414,
+        "[]-": MASSES["N_TERMINUS"],
+        "-[]": MASSES["C_TERMINUS"],
+    }
+)
+
+MOD_MASSES = _ReadOnlyDict(
+    {
+        "[UNIMOD:737]": 229.162932,  # TMT_6
+        "[UNIMOD:2016]": 304.207146,  # TMT_PRO
+        "[UNIMOD:214]": 144.102063,  # iTRAQ4
+        "[UNIMOD:730]": 304.205360,  # iTRAQ8
+        "[UNIMOD:259]": 8.014199,  # SILAC Lysine
+        "[UNIMOD:267]": 10.008269,  # SILAC Arginine
+        "[]": 0.0,
+        "[UNIMOD:1]": 42.010565,  # Acetylation
+        "[UNIMOD:1896]": 158.003765,  # DSSO-crosslinker
+        "[UNIMOD:1881]": 54.010565,  # Alkene short fragment of DSSO-crosslinker
+        "[UNIMOD:1882]": 85.982635,  # Thiol long fragment of DSSO-crosslinker
+        "[UNIMOD:1884]": 196.084792,  # BuUrBu (DSBU)-crosslinker
+        "[UNIMOD:1885]": 111.032028,  # BuUr long fragment of BuUrBu (DSBU)-crosslinker
+        "[UNIMOD:1886]": 85.052764,  # Bu short fragment of BuUrBu (DSBU)-crosslinker
+        "[UNIMOD:1898]": 138.068080,  # DSS and BS3 non-cleavable crosslinker
+        "[UNIMOD:122]": 27.994915,  # Formylation
+        "[UNIMOD:1289]": 70.041865,  # Butyrylation
+        "[UNIMOD:1363]": 68.026215,  # Crotonylation
+        "[UNIMOD:1848]": 114.031694,  # Glutarylation
+        "[UNIMOD:1914]": -32.008456,  # Oxidation and then loss of oxidized M side chain
+        "[UNIMOD:2]": -0.984016,  # Amidation
+        "[UNIMOD:21]": 79.966331,  # Phosphorylation
+        "[UNIMOD:213]": 541.06111,  # ADP-ribosylation
+        "[UNIMOD:23]": -18.010565,  # Water Loss
+        "[UNIMOD:24]": 71.037114,  # Propionamidation
+        "[UNIMOD:354]": 44.985078,  # Nitrosylation
+        "[UNIMOD:28]": -17.026549,  # Glu to PyroGlu
+        "[UNIMOD:280]": 28.0313,  # Ethylation
+        "[UNIMOD:299]": 43.989829,  # Carboxylation
+        "[UNIMOD:3]": 226.077598,  # Biotinylation
+        "[UNIMOD:34]": 14.01565,  # Methylation
+        "[UNIMOD:345]": 47.984744,  # Trioxidation
+        "[UNIMOD:35]": 15.994915,  # Hydroxylation
+        "[UNIMOD:351]": 3.994915,  # Oxidation to Kynurenine
+        "[UNIMOD:36]": 28.0313,  # Dimethylation
+        "[UNIMOD:360]": -30.010565,  # Pyrrolidinone
+        "[UNIMOD:368]": -33.987721,  # Dehydroalanine
+        "[UNIMOD:37]": 42.04695,  # Trimethylation
+        "[UNIMOD:385]": -17.026549,  # Ammonia loss
+        "[UNIMOD:392]": 29.974179,  # Quinone
+        "[UNIMOD:4]": 57.021464,  # Carbamidomethyl
+        "[UNIMOD:40]": 79.956815,  # Sulfonation
+        "[UNIMOD:401]": -2.01565,  # Didehydro
+        "[UNIMOD:425]": 31.989829,  # Dioxidation
+        "[UNIMOD:43]": 203.079373,  # HexNAc
+        "[UNIMOD:44]": 204.187801,  # Farnesylation
+        "[UNIMOD:447]": -15.994915,  # Reduction
+        "[UNIMOD:46]": 229.014009,  # Pyridoxal phosphate
+        "[UNIMOD:47]": 238.229666,  # Palmitoylation
+        "[UNIMOD:5]": 43.005814,  # Carbamyl
+        "[UNIMOD:58]": 56.026215,  # Propionylation
+        "[UNIMOD:6]": 58.005479,  # Carboxymethylation
+        "[UNIMOD:64]": 100.016044,  # Succinylation
+        "[UNIMOD:7]": 0.984016,  # Deamidation
+        "[UNIMOD:747]": 86.000394,  # Malonylation
+    }
+)
 
 MOD_MASSES_SAGE = {
     229.1629: "[UNIMOD:737]",
@@ -246,79 +274,131 @@ MOD_MASSES_SAGE = {
     15.9949: "[UNIMOD:35]",
     42.0105: "[UNIMOD:1]",
 }
+# (key, amino acid, modification) used to build AA_MOD_MASSES, a modification of None means the key is only used
+# for encoding and gets the unmodified mass. This is needed because different mods on the same amino acid would
+# otherwise require a different way of encoding to make VEC_MZ work
+_AA_MOD_SPEC = [
+    ("K[UNIMOD:737]", "K", "[UNIMOD:737]"),
+    ("M[UNIMOD:35]", "M", "[UNIMOD:35]"),
+    ("C[UNIMOD:4]", "C", "[UNIMOD:4]"),
+    ("K[UNIMOD:2016]", "K", "[UNIMOD:2016]"),
+    ("K[UNIMOD:214]", "K", "[UNIMOD:214]"),
+    ("K[UNIMOD:730]", "K", "[UNIMOD:730]"),
+    ("S[UNIMOD:21]", "S", "[UNIMOD:21]"),
+    ("T[UNIMOD:21]", "T", "[UNIMOD:21]"),
+    ("Y[UNIMOD:21]", "Y", "[UNIMOD:21]"),
+    ("S[UNIMOD:23]", "S", None),
+    ("T[UNIMOD:23]", "T", None),
+    ("Y[UNIMOD:23]", "Y", None),
+    ("K[UNIMOD:1896]", "K", "[UNIMOD:1896]"),
+    ("K[UNIMOD:1881]", "K", "[UNIMOD:1881]"),
+    ("K[UNIMOD:1882]", "K", "[UNIMOD:1882]"),
+    ("K[UNIMOD:1884]", "K", "[UNIMOD:1884]"),
+    ("K[UNIMOD:1885]", "K", "[UNIMOD:1885]"),
+    ("K[UNIMOD:1886]", "K", "[UNIMOD:1886]"),
+    ("K[UNIMOD:1898]", "K", "[UNIMOD:1898]"),
+    ("[UNIMOD:1]-", "[]-", "[UNIMOD:1]"),  # the mass of "[]-" is the n-terminus
+    ("K[UNIMOD:259]", "K", None),
+    ("R[UNIMOD:267]", "R", None),
+]
+
 # these are only used for prosit_grpc, oktoberfest uses the masses from MOD_MASSES
 AA_MOD_MASSES = {
-    "K[UNIMOD:737]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:737]"],
-    "M[UNIMOD:35]": AA_MASSES["M"] + MOD_MASSES["[UNIMOD:35]"],
-    "C[UNIMOD:4]": AA_MASSES["C"] + MOD_MASSES["[UNIMOD:4]"],
-    "K[UNIMOD:2016]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:2016]"],
-    "K[UNIMOD:214]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:214]"],
-    "K[UNIMOD:730]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:730]"],
-    "S[UNIMOD:21]": AA_MASSES["S"] + MOD_MASSES["[UNIMOD:21]"],
-    "T[UNIMOD:21]": AA_MASSES["T"] + MOD_MASSES["[UNIMOD:21]"],
-    "Y[UNIMOD:21]": AA_MASSES["Y"] + MOD_MASSES["[UNIMOD:21]"],
-    "S[UNIMOD:23]": AA_MASSES["S"],  # + MOD_MASSES['[UNIMOD:23]'],
-    "T[UNIMOD:23]": AA_MASSES["T"],  # + MOD_MASSES['[UNIMOD:23]'],
-    "Y[UNIMOD:23]": AA_MASSES["Y"],  # + MOD_MASSES['[UNIMOD:23]'],
-    "K[UNIMOD:1896]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1896]"],
-    "K[UNIMOD:1881]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1881]"],
-    "K[UNIMOD:1882]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1882]"],
-    "K[UNIMOD:1884]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1884]"],
-    "K[UNIMOD:1885]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1885]"],
-    "K[UNIMOD:1886]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1886]"],
-    "K[UNIMOD:1898]": AA_MASSES["K"] + MOD_MASSES["[UNIMOD:1898]"],
-    "[UNIMOD:1]-": MASSES["N_TERMINUS"] + MOD_MASSES["[UNIMOD:1]"],
-    "K[UNIMOD:259]": AA_MASSES[
-        "K"
-    ],  # + MOD_MASSES['[UNIMOD:259]'],#we need a different way of encoding mods on AA so it wouldn't have same encoding
-    # to make vecMZ work
-    "R[UNIMOD:267]": AA_MASSES["R"],  # + MOD_MASSES['[UNIMOD:267]']
+    key: AA_MASSES[amino_acid] + MOD_MASSES[mod] if mod is not None else AA_MASSES[amino_acid]
+    for key, amino_acid, mod in _AA_MOD_SPEC
 }
 
-AA_MOD = {**AA_MASSES, **AA_MOD_MASSES}
+AA_MOD = _ReadOnlyDict({**AA_MASSES, **AA_MOD_MASSES})
 
 #######################################
 # HELPERS FOR FRAGMENT MZ CALCULATION #
 #######################################
 
+
 # Array containing masses --- at index one is mass for A, etc.
 # these are only used for prosit_grpc, oktoberfest uses the masses from MOD_MASSES
-VEC_MZ = np.zeros(max(ALPHABET.values()) + 1)
-for a, i in ALPHABET.items():
-    VEC_MZ[i] = AA_MOD[a]
+def _build_vec_mz() -> Dict[str, Any]:
+    """Build VEC_MZ and VEC_MZ_F32."""
+    import numpy as np
 
-# small positive intensity to distinguish invalid ion (=0) from missing peak (=EPSILON)
-EPSILON = 1e-7
+    indices = np.fromiter(ALPHABET.values(), dtype=np.int32)
+    vec_mz = np.zeros(indices.max() + 1)
+    vec_mz[indices] = np.fromiter((AA_MOD[a] for a in ALPHABET), dtype=np.float64)
+    # half the size for bandwidth bound lookups, only use where float32 precision of the summed masses is sufficient
+    return {"VEC_MZ": vec_mz, "VEC_MZ_F32": vec_mz.astype(np.float32)}
 
-B_ION_MASK = np.tile([0, 0, 0, 1, 1, 1], SEQ_LEN - 1)
-Y_ION_MASK = np.tile([1, 1, 1, 0, 0, 0], SEQ_LEN - 1)
-SINGLE_CHARGED_MASK = np.tile([1, 0, 0, 1, 0, 0], SEQ_LEN - 1)
-DOUBLE_CHARGED_MASK = np.tile([0, 1, 0, 0, 1, 0], SEQ_LEN - 1)
-TRIPLE_CHARGED_MASK = np.tile([0, 0, 1, 0, 0, 1], SEQ_LEN - 1)
-
-B_ION_MASK_XL = np.tile([0, 0, 0, 1, 1, 1], (SEQ_LEN - 1) * 2)
-Y_ION_MASK_XL = np.tile([1, 1, 1, 0, 0, 0], (SEQ_LEN - 1) * 2)
-SINGLE_CHARGED_MASK_XL = np.tile([1, 0, 0, 1, 0, 0], (SEQ_LEN - 1) * 2)
-DOUBLE_CHARGED_MASK_XL = np.tile([0, 1, 0, 0, 1, 0], (SEQ_LEN - 1) * 2)
-TRIPLE_CHARGED_MASK_XL = np.tile([0, 0, 1, 0, 0, 1], (SEQ_LEN - 1) * 2)
-
-
-MASK_DICT = {
-    1: SINGLE_CHARGED_MASK,
-    2: DOUBLE_CHARGED_MASK,
-    3: TRIPLE_CHARGED_MASK,
-    4: B_ION_MASK,
-    5: Y_ION_MASK,
-}
 
+# small positive intensity to distinguish invalid ion (=0) from missing peak (=EPSILON)
+EPSILON = 1e-7
 
-MASK_DICT_XL = {
-    1: SINGLE_CHARGED_MASK_XL,
-    2: DOUBLE_CHARGED_MASK_XL,
-    3: TRIPLE_CHARGED_MASK_XL,
-    4: B_ION_MASK_XL,
-    5: Y_ION_MASK_XL,
-}
+# all ion masks packed into one byte per fragment, bits 0/1/2 for charge 1+/2+/3+ and bits 3/4 for b/y ions,
+# fragments are ordered y1+, y2+, y3+, b1+, b2+, b3+ for each position
+SINGLE_CHARGED_BIT = 1
+DOUBLE_CHARGED_BIT = 2
+TRIPLE_CHARGED_BIT = 4
+B_ION_BIT = 8
+Y_ION_BIT = 16
+
+
+def _build_ion_masks() -> Dict[str, Any]:
+    """Build the packed ion bits, the read-only ion masks and MASK_DICT / MASK_DICT_XL."""
+    import numpy as np
+
+    ion_bits_pattern = np.array(
+        [
+            Y_ION_BIT | SINGLE_CHARGED_BIT,
+            Y_ION_BIT | DOUBLE_CHARGED_BIT,
+            Y_ION_BIT | TRIPLE_CHARGED_BIT,
+            B_ION_BIT | SINGLE_CHARGED_BIT,
+            B_ION_BIT | DOUBLE_CHARGED_BIT,
+            B_ION_BIT | TRIPLE_CHARGED_BIT,
+        ],
+        dtype=np.uint8,
+    )
+    ion_bits = np.tile(ion_bits_pattern, SEQ_LEN - 1)
+    ion_bits_xl = np.tile(ion_bits_pattern, (SEQ_LEN - 1) * 2)
+    ion_bits.setflags(write=False)
+    ion_bits_xl.setflags(write=False)
+
+    def mask(bits: np.ndarray, bit: int) -> np.ndarray:
+        unpacked = (bits & bit != 0).astype(np.uint8)
+        unpacked.setflags(write=False)
+        return unpacked
+
+    masks = {
+        "B_ION_MASK": mask(ion_bits, B_ION_BIT),
+        "Y_ION_MASK": mask(ion_bits, Y_ION_BIT),
+        "SINGLE_CHARGED_MASK": mask(ion_bits, SINGLE_CHARGED_BIT),
+        "DOUBLE_CHARGED_MASK": mask(ion_bits, DOUBLE_CHARGED_BIT),
+        "TRIPLE_CHARGED_MASK": mask(ion_bits, TRIPLE_CHARGED_BIT),
+        "B_ION_MASK_XL": mask(ion_bits_xl, B_ION_BIT),
+        "Y_ION_MASK_XL": mask(ion_bits_xl, Y_ION_BIT),
+        "SINGLE_CHARGED_MASK_XL": mask(ion_bits_xl, SINGLE_CHARGED_BIT),
+        "DOUBLE_CHARGED_MASK_XL": mask(ion_bits_xl, DOUBLE_CHARGED_BIT),
+        "TRIPLE_CHARGED_MASK_XL": mask(ion_bits_xl, TRIPLE_CHARGED_BIT),
+    }
+    mask_dict = {
+        1: masks["SINGLE_CHARGED_MASK"],
+        2: masks["DOUBLE_CHARGED_MASK"],
+        3: masks["TRIPLE_CHARGED_MASK"],
+        4: masks["B_ION_MASK"],
+        5: masks["Y_ION_MASK"],
+    }
+    mask_dict_xl = {
+        1: masks["SINGLE_CHARGED_MASK_XL"],
+        2: masks["DOUBLE_CHARGED_MASK_XL"],
+        3: masks["TRIPLE_CHARGED_MASK_XL"],
+        4: masks["B_ION_MASK_XL"],
+        5: masks["Y_ION_MASK_XL"],
+    }
+    return {
+        "ION_BITS_PATTERN": ion_bits_pattern,
+        "ION_BITS": ion_bits,
+        "ION_BITS_XL": ion_bits_xl,
+        **masks,
+        "MASK_DICT": mask_dict,
+        "MASK_DICT_XL": mask_dict_xl,
+    }
 
 
 SHARED_DATA_COLUMNS = ["RAW_FILE", "SCAN_NUMBER"]
@@ -383,19 +463,26 @@ FRAGMENTATION_ENCODING = {"HCD": 2, "CID": 1}
 
 IONS = ["y", "b"]  # limited to single character unicode string when array is created
 CHARGES = [1, 2, 3]  # limited to uint8 (0-255) when array is created
-POSITIONS = [x for x in range(1, 30)]  # fragment numbers 1-29 -- limited to uint8 (0-255) when array is created
 
-ANNOTATION_FRAGMENT_TYPE = []
-ANNOTATION_FRAGMENT_CHARGE = []
-ANNOTATION_FRAGMENT_NUMBER = []
-for pos in POSITIONS:
-    for ion in IONS:
-        for charge in CHARGES:
-            ANNOTATION_FRAGMENT_TYPE.append(ion)
-            ANNOTATION_FRAGMENT_CHARGE.append(charge)
-            ANNOTATION_FRAGMENT_NUMBER.append(pos)
 
-ANNOTATION = [ANNOTATION_FRAGMENT_TYPE, ANNOTATION_FRAGMENT_CHARGE, ANNOTATION_FRAGMENT_NUMBER]
+def _build_annotation() -> Dict[str, Any]:
+    """Build POSITIONS and the read-only ANNOTATION arrays."""
+    import numpy as np
+
+    positions = np.arange(1, SEQ_LEN, dtype=np.uint8)  # fragment numbers 1-29
+    # fragments are ordered by position, then ion type, then charge
+    fragment_type = np.tile(np.repeat(np.array(IONS, dtype="U1"), len(CHARGES)), len(positions))
+    fragment_charge = np.tile(np.array(CHARGES, dtype=np.uint8), len(positions) * len(IONS))
+    fragment_number = np.repeat(positions, len(IONS) * len(CHARGES))
+    for annotation_array in (fragment_type, fragment_charge, fragment_number):
+        annotation_array.setflags(write=False)
+    return {
+        "POSITIONS": positions,
+        "ANNOTATION_FRAGMENT_TYPE": fragment_type,
+        "ANNOTATION_FRAGMENT_CHARGE": fragment_charge,
+        "ANNOTATION_FRAGMENT_NUMBER": fragment_number,
+        "ANNOTATION": [fragment_type, fragment_charge, fragment_number],
+    }
 
 
 ########################
@@ -408,3 +495,59 @@ class RescoreType(Enum):
 
     PROSIT = "prosit"
     ANDROMEDA = "andromeda"
+
+
+##################
+# LAZY CONSTANTS #
+##################
+
+# the numpy constants are built on first access, so that importing this module does not import numpy
+_LAZY_CONSTANTS = {
+    "VEC_MZ": _build_vec_mz,
+    "VEC_MZ_F32": _build_vec_mz,
+    "ION_BITS_PATTERN": _build_ion_masks,
+    "ION_BITS": _build_ion_masks,
+    "ION_BITS_XL": _build_ion_masks,
+    "B_ION_MASK": _build_ion_masks,
+    "Y_ION_MASK": _build_ion_masks,
+    "SINGLE_CHARGED_MASK": _build_ion_masks,
+    "DOUBLE_CHARGED_MASK": _build_ion_masks,
+    "TRIPLE_CHARGED_MASK": _build_ion_masks,
+    "B_ION_MASK_XL": _build_ion_masks,
+    "Y_ION_MASK_XL": _build_ion_masks,
+    "SINGLE_CHARGED_MASK_XL": _build_ion_masks,
+    "DOUBLE_CHARGED_MASK_XL": _build_ion_masks,
+    "TRIPLE_CHARGED_MASK_XL": _build_ion_masks,
+    "MASK_DICT": _build_ion_masks,
+    "MASK_DICT_XL": _build_ion_masks,
+    "POSITIONS": _build_annotation,
+    "ANNOTATION_FRAGMENT_TYPE": _build_annotation,
+    "ANNOTATION_FRAGMENT_CHARGE": _build_annotation,
+    "ANNOTATION_FRAGMENT_NUMBER": _build_annotation,
+    "ANNOTATION": _build_annotation,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build a lazy constant together with the constants that share its builder on first access.
+
+    The built constants are stored as regular module attributes, so this is only called once per builder.
+
+    :param name: name of the requested attribute
+    :raises AttributeError: if name is not a constant of this module
+    :return: the value of the constant
+    """
+    if name not in _LAZY_CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals().update(_LAZY_CONSTANTS[name]())
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    """
+    List the attributes of this module including the lazy constants that were not built yet.
+
+    :return: sorted list of attribute names
+    """
+    return sorted({*globals(), *_LAZY_CONSTANTS})
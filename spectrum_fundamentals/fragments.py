@@ -1,66 +1,135 @@
 import logging
 import re
-from operator import itemgetter
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from . import constants as constants
-from .mod_string import internal_without_mods
 
 logger = logging.getLogger(__name__)
 
+# matches every bracketed token, i.e. unimod modifications and the unmodified termini [], as well as
+# parenthesized modifications of other formats, e.g. (ox), which are not in MOD_MASSES and raise a KeyError
+# [^\]]* matches anything but ] greedily till it finds the closing bracket, which is 1 step
+# compiled once, all modifications are found in a single pass and looked up in MOD_MASSES
+_MODIFICATION_PATTERN = re.compile(r"\[[^\]]*\]|\([^)]*\)")
+
+# masses used for every peptide, resolved once instead of looking them up in the constants on every call
+_H = constants.ATOM_MASSES["H"]
+_O = constants.ATOM_MASSES["O"]
+_PROTON = constants.PARTICLE_MASSES["PROTON"]
+# fragment charges of compute_ion_masses and the masses of their protons
+_ION_CHARGES = np.array(constants.CHARGES)
+_ION_PROTON_MASSES = _ION_CHARGES * _PROTON
+# charges of the columns y1+, y2+, y3+, b1+, b2+, b3+ of the ion masses
+_ION_COLUMN_CHARGES = np.tile(_ION_CHARGES, 2)
+# fragment ion types are int8 ids in the peak columns, the ids of the b and y ions are the ids of the kernel
+# and the crosslinked variants of an ion type are offset by the id of their suffix
+_B_ION, _Y_ION = 0, 1
+_XL_ION_TYPE_OFFSETS = {"short": 2, "long": 4, "xl": 6}
+_ION_TYPE_LABELS = np.array(
+    ["b", "y"] + [f"{ion_type}-{suffix}" for suffix in _XL_ION_TYPE_OFFSETS for ion_type in ("b", "y")],
+    dtype=object,
+)
+# mass offsets of the b and the y ions
+_ION_TYPE_OFFSETS = [0.0, _O + 2 * _H]
+
+# amino acid masses indexed by the ascii code of the one letter code, nan for unknown characters
+_AA_MASS_LUT = np.full(128, np.nan)
+for _aa, _aa_mass in constants.AA_MASSES.items():
+    if len(_aa) == 1:
+        _AA_MASS_LUT[ord(_aa)] = _aa_mass
+
 
 def _get_modifications(peptide_sequence: str) -> Dict[int, float]:
     """
     Get modification masses and position in a peptide sequence.
 
-    This function expects a peptide sequence in unimod format, parses the modifications and stores
-    the mass deltas for each position off aa in a dictionary where keys are the position in the
-    unmodified sequence and values are the masses of the modifications attached to the aa at that
-    position. In case of an n-terminal modification, it is stored at position -2 (technical reasons)
-    The mass deltas along with the unmodified sequence and information about whether an n-terminal
-    modification was present are returned.
+    See _parse_modifications for details. The parsed modifications are cached, since the same peptides are
+    usually processed many times, e.g. for different charges or scans, or for the short and long crosslinker
+    variants. A new dictionary is returned for every call, so it can be modified by the caller.
 
     :param peptide_sequence: Modified peptide sequence
     :return: modification_deltas
     """
+    return dict(_parse_modifications(peptide_sequence)[0])
+
+
+def _get_modifications_and_sequence(peptide_sequence: str) -> Tuple[Dict[int, float], str]:
+    """
+    Get modification masses and position together with the unmodified sequence from a single cached parse.
+
+    :param peptide_sequence: Modified peptide sequence
+    :return: modification_deltas as in _get_modifications and the unmodified sequence, which is the unchanged
+        peptide_sequence if there are no modifications
+    """
+    modification_pairs, sequence = _parse_modifications(peptide_sequence)
+    return dict(modification_pairs), sequence
+
+
+@lru_cache(maxsize=131072)
+def _parse_modifications(peptide_sequence: str) -> Tuple[Tuple[Tuple[int, float], ...], str]:
+    """
+    Get modification masses and position in a peptide sequence.
+
+    This function expects a peptide sequence in unimod format, parses the modifications and stores
+    the mass deltas for each position off aa as (position, mass) pairs where the position is the
+    position in the unmodified sequence and the mass is the mass of the modification attached to the
+    aa at that position. In case of an n-terminal modification, it is stored at position -2 (technical reasons)
+    The pairs are immutable, so they can be cached. The unmodified sequence is joined from the parts between
+    the modifications of the same pass instead of parsing the sequence again.
+
+    :param peptide_sequence: Modified peptide sequence
+    :return: modification_deltas as (position, mass) pairs and the unmodified sequence
+    """
     modification_deltas = {}
     offset = 1  # shift position of mod start in seq by one to the left to reflect position of aa
     if peptide_sequence.startswith("["):  # n-term mod => seq must be [UNIMOD:xyz]-X...
         offset = 2  # need to add one more offset, because of the dash '-', n_terminal stored at -1
 
-    # fastest regex for modification mathing without lookback, since we know it must be unimod syntax
-    # .{8} skips 8 positions entirely without checking greedily, that is len("UNIMOD:") + at least one digit
-    # [^\]*] matches anything but ] greedily till it finds the closing bracket, which is 1 step
-    pattern = re.compile(r"\[.{8}[^\]]*\]")
-    matches = pattern.finditer(peptide_sequence)
+    matches = _MODIFICATION_PATTERN.finditer(peptide_sequence)
+    sequence_parts = []
+    last_end_pos = 0
 
     for match in matches:
         start_pos = match.start()
         end_pos = match.end()
         modification_deltas[start_pos - offset] = constants.MOD_MASSES[peptide_sequence[start_pos:end_pos]]
         offset += end_pos - start_pos
+        sequence_parts.append(peptide_sequence[last_end_pos:start_pos])
+        last_end_pos = end_pos
+
+    if not modification_deltas:
+        return (), peptide_sequence
 
-    return modification_deltas
+    sequence_parts.append(peptide_sequence[last_end_pos:])
+    sequence = "".join(sequence_parts).replace("-", "")
+    return tuple(modification_deltas.items()), sequence
 
 
+@lru_cache(maxsize=131072)
 def compute_peptide_mass(sequence: str) -> float:
     """
     Compute the theoretical mass of the peptide sequence.
 
+    The masses are cached by sequence.
+
     :param sequence: Modified peptide sequence
     :return: Theoretical mass of the sequence
     """
-    terminal_masses = 2 * constants.ATOM_MASSES["H"] + constants.ATOM_MASSES["O"]  # add terminal masses HO- and H-
+    terminal_masses = 2 * _H + _O  # add terminal masses HO- and H-
 
-    modification_deltas = _get_modifications(sequence)
+    modification_deltas, sequence = _get_modifications_and_sequence(sequence)
     if modification_deltas:  # there were modifictions
-        sequence = internal_without_mods([sequence])[0]
         terminal_masses += modification_deltas.get(-2, 0.0)  # prime with n_term_mod delta if present
 
-    peptide_sum = sum([constants.AA_MASSES[c] + modification_deltas.get(i, 0.0) for i, c in enumerate(sequence)])
+    masses = _amino_acid_masses(sequence)
+    for position, delta in modification_deltas.items():
+        if 0 <= position < len(masses):
+            masses[position] += delta
+    # the builtin sum adds the masses one by one from left to right, unlike the pairwise summation of np.sum
+    peptide_sum = sum(masses.tolist())
 
     return terminal_masses + peptide_sum
 
@@ -104,86 +173,372 @@ def initialize_peaks(
     :param xl_pos: the position of the crosslinker for non-cleavable XL
     :return: List of theoretical peaks, Flag to indicate if there is a tmt on n-terminus, Un modified peptide sequence
     """
-    _xl_sanity_check(noncl_xl, peptide_beta_mass, xl_pos)
+    fragment_columns, n_term_mod, sequence, mass = _initialize_peak_columns(
+        sequence, mass_analyzer, charge, mass_tolerance, unit_mass_tolerance, noncl_xl, peptide_beta_mass, xl_pos
+    )
+    return _to_records(fragment_columns), n_term_mod, sequence, mass
 
-    max_charge = min(3, charge)
-    ion_type_offsets = [0.0, constants.ATOM_MASSES["O"] + 2 * constants.ATOM_MASSES["H"]]
 
-    # tmp place holder
-    ion_type_masses = [0.0, 0.0]
-    ion_types = ["b", "y"]
+def _initialize_peak_columns(
+    sequence: str,
+    mass_analyzer: str,
+    charge: int,
+    mass_tolerance: Optional[float] = None,
+    unit_mass_tolerance: Optional[str] = None,
+    noncl_xl: bool = False,
+    peptide_beta_mass: float = 0.0,
+    xl_pos: int = -1,
+) -> Tuple[Dict[str, np.ndarray], int, str, float]:
+    """
+    Generate theoretical peaks for a modified peptide sequence as columns instead of one dictionary per peak.
 
-    number_of_ion_types = len(ion_type_offsets)
-    fragments_meta_data = []
+    See initialize_peaks for the parameters. The columns are ion_type, no, charge, mass, min_mass and max_mass,
+    each an array with one entry per fragment, sorted by mass. The ion types are int8 ids, see _ION_TYPE_LABELS.
+
+    :param sequence: Modified peptide sequence
+    :param mass_analyzer: Type of mass analyzer used eg. FTMS, ITMS
+    :param charge: Precursor charge
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :param noncl_xl: whether the function is called with a non-cleavable xl modification
+    :param peptide_beta_mass: the mass of the second peptide to be considered for non-cleavable XL
+    :param xl_pos: the position of the crosslinker for non-cleavable XL
+    :return: Columns of theoretical peaks, Flag to indicate if there is a tmt on n-terminus, Un modified peptide
+        sequence, theoretical mass of the modified peptide
+    """
+    _xl_sanity_check(noncl_xl, peptide_beta_mass, xl_pos)
 
-    modification_deltas = _get_modifications(sequence)
-    forward_sum = 0.0  # sum over all amino acids from left to right (neutral charge)
-    backward_sum = 0.0  # sum over all amino acids from right to left (neutral charge)
+    modification_masses, n_term_mod, sequence = _get_modification_masses(sequence)
+    forward_sums, backward_sums = _cumulative_masses(sequence, modification_masses)
+    fragment_columns = _peak_columns(
+        forward_sums,
+        backward_sums,
+        mass_analyzer,
+        min(3, charge),
+        mass_tolerance,
+        unit_mass_tolerance,
+        noncl_xl,
+        xl_pos,
+        peptide_beta_mass,
+    )
+    forward_sum = forward_sums[-1] if len(forward_sums) > 0 else 0.0
+    return fragment_columns, n_term_mod, sequence, float(forward_sum + _ION_TYPE_OFFSETS[0] + _ION_TYPE_OFFSETS[1])
+
+
+@lru_cache(maxsize=131072)
+def _get_modification_masses(sequence: str) -> Tuple[np.ndarray, int, str]:
+    """
+    Get the modification mass of each amino acid with the n-terminal modification added to the first amino acid.
+
+    The masses are a float64 array with one entry per amino acid, zero if it is not modified, so they are added
+    to the amino acid masses in one vectorized step instead of one python float at a time. The arrays are
+    cached by sequence and read-only, since they are shared between calls.
+
+    :param sequence: Modified peptide sequence
+    :return: modification masses, Flag to indicate if there is a tmt on n-terminus, Un modified peptide sequence
+    """
+    modification_pairs, sequence = _parse_modifications(sequence)
+    modification_masses = np.zeros(len(sequence))
     n_term_mod = 1
-    if modification_deltas:  # there were modifictions
-        sequence = internal_without_mods([sequence])[0]
-        n_term_delta = modification_deltas.get(-2, 0.0)
-        if n_term_delta != 0:
-            n_term_mod = 2
-            # add n_term mass to first aa for easy processing in the following calculation
-            modification_deltas[0] = modification_deltas.get(0, 0.0) + n_term_delta
-
-    # calculation:
-
-    peptide_length = len(sequence)
-    for i in range(peptide_length):  # generate substrings
-        forward_sum += constants.AA_MASSES[sequence[i]]  # sum left to right
-        if i in modification_deltas:  # add mass of modification if present
-            forward_sum += modification_deltas[i]
-        backward_sum += constants.AA_MASSES[sequence[peptide_length - i - 1]]  # sum right to left
-        if peptide_length - i - 1 in modification_deltas:  # add mass of modification if present
-            backward_sum += modification_deltas[peptide_length - i - 1]
-
-        ion_type_masses[0] = forward_sum + ion_type_offsets[0]  # b ion - ...
-
-        ion_type_masses[1] = backward_sum + ion_type_offsets[1]  # y ion
-
-        for charge in range(constants.MIN_CHARGE, max_charge + 1):  # generate ion in different charge states
-            # positive charge is introduced by protons (or H - ELECTRON_MASS)
-            charge_delta = charge * constants.PARTICLE_MASSES["PROTON"]
-            for ion_type in range(number_of_ion_types):  # generate all ion types
-                mass = _compute_ion_mass(
-                    ion_mass=ion_type_masses[ion_type],
-                    noncl_xl=noncl_xl,
-                    ion_type=ion_type,
-                    xl_pos=xl_pos,
-                    peptide_beta_mass=peptide_beta_mass,
-                    peptide_length=peptide_length,
-                    i=i,
-                )
-                mz = (mass + charge_delta) / charge
-                min_mz, max_mz = get_min_max_mass(mass_analyzer, mz, mass_tolerance, unit_mass_tolerance)
-
-                fragments_meta_data.append(
-                    {
-                        "ion_type": ion_types[ion_type],  # ion type
-                        "no": i + 1,  # no
-                        "charge": charge,  # charge
-                        "mass": mz,  # mz
-                        "min_mass": min_mz,  # min mz
-                        "max_mass": max_mz,  # max mz
-                    }
-                )
-    fragments_meta_data = sorted(fragments_meta_data, key=itemgetter("mass"))
-    return fragments_meta_data, n_term_mod, sequence, (forward_sum + ion_type_offsets[0] + ion_type_offsets[1])
-
-
-def _compute_ion_mass(
-    ion_mass: float, noncl_xl: bool, ion_type: int, xl_pos: int, peptide_beta_mass: float, peptide_length: int, i: int
-) -> float:
-    # Check for neutral loss here
-
-    if noncl_xl and ((ion_type == 0 and i + 1 >= xl_pos) or (ion_type == 1 and i >= peptide_length - xl_pos)):
-        mass = ion_mass + peptide_beta_mass
-    else:
-        mass = ion_mass
+    n_term_delta = 0.0
+    for position, delta in modification_pairs:
+        if 0 <= position < len(sequence):
+            modification_masses[position] = delta
+        elif position == -2:
+            n_term_delta = delta
+    if n_term_delta != 0:
+        n_term_mod = 2
+        # add n_term mass to first aa for easy processing in the following calculation
+        if len(sequence) > 0:
+            modification_masses[0] += n_term_delta
+    modification_masses.flags.writeable = False
+    return modification_masses, n_term_mod, sequence
+
+
+def _peak_columns(
+    forward_sums: np.ndarray,
+    backward_sums: np.ndarray,
+    mass_analyzer: str,
+    max_charge: int,
+    mass_tolerance: Optional[float] = None,
+    unit_mass_tolerance: Optional[str] = None,
+    noncl_xl: bool = False,
+    xl_pos: int = -1,
+    peptide_beta_mass: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the columns of theoretical peaks from the cumulative amino acid masses, sorted by mass.
+
+    :param forward_sums: sums over the amino acids from left to right (neutral charge)
+    :param backward_sums: sums over the amino acids from right to left (neutral charge)
+    :param mass_analyzer: Type of mass analyzer used eg. FTMS, ITMS
+    :param max_charge: the highest charge state of the fragments
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :param noncl_xl: whether the function is called with a non-cleavable xl modification
+    :param peptide_beta_mass: the mass of the second peptide to be considered for non-cleavable XL
+    :param xl_pos: the position of the crosslinker for non-cleavable XL
+    :return: the columns ion_type, no, charge, mass, min_mass and max_mass
+    """
+    mz, ion_type_ids, numbers, fragment_charges = _fragment_mz_kernel(
+        forward_sums, backward_sums, _ION_TYPE_OFFSETS, max_charge, noncl_xl, xl_pos, peptide_beta_mass
+    )
+    # a stable sort keeps fragments with the same mass in the order of the kernel, like sorting the peaks did
+    order = np.argsort(mz, kind="stable")
+    mz = mz[order]
+    # the mass window is computed from the sorted masses, so it does not need to be permuted as well
+    min_mz, max_mz = get_min_max_mass_batch(mass_analyzer, mz, mass_tolerance, unit_mass_tolerance)
+    return {
+        "ion_type": ion_type_ids[order],
+        "no": numbers[order],
+        "charge": fragment_charges[order],
+        "mass": mz,
+        "min_mass": min_mz,
+        "max_mass": max_mz,
+    }
+
+
+def _to_records(fragment_columns: Dict[str, np.ndarray]) -> List[dict]:
+    """
+    Convert columns of theoretical peaks to a list with one dictionary per peak.
+
+    :param fragment_columns: columns of theoretical peaks as returned by _initialize_peak_columns
+    :return: List of theoretical peaks with python scalars as values
+    """
+    return [
+        {
+            "ion_type": ion_type,  # ion type
+            "no": no,  # no
+            "charge": fragment_charge,  # charge
+            "mass": mass,  # mz
+            "min_mass": min_mass,  # min mz
+            "max_mass": max_mass,  # max mz
+        }
+        for ion_type, no, fragment_charge, mass, min_mass, max_mass in zip(
+            _ION_TYPE_LABELS[fragment_columns["ion_type"]].tolist(),
+            fragment_columns["no"].tolist(),
+            fragment_columns["charge"].tolist(),
+            fragment_columns["mass"].tolist(),
+            fragment_columns["min_mass"].tolist(),
+            fragment_columns["max_mass"].tolist(),
+        )
+    ]
+
+
+def _amino_acid_masses(sequence: str) -> np.ndarray:
+    """
+    Look up the masses of all amino acids of an unmodified peptide sequence at once.
+
+    :param sequence: unmodified peptide sequence
+    :raises KeyError: if the sequence contains a character that is not an amino acid of AA_MASSES
+    :return: array with the mass of each amino acid
+    """
+    masses = _AA_MASS_LUT[np.frombuffer(sequence.encode("ascii", errors="replace"), dtype=np.uint8)]
+    unknown = np.isnan(masses)
+    if unknown.any():
+        raise KeyError(sequence[int(unknown.argmax())])
+    return masses
+
+
+def _cumulative_masses(sequence: str, modification_masses: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum the amino acid and modification masses from left to right and from right to left.
+
+    Amino acid and modification masses are interleaved before the cumulative sum, so that each mass is added
+    separately in the same order as a running sum over the amino acids would add them.
+
+    :param sequence: unmodified peptide sequence
+    :param modification_masses: modification mass of each amino acid of the sequence
+    :return: forward and backward sums after each amino acid (neutral charge)
+    """
+    forward_sums, backward_sums = _variant_cumulative_masses(sequence, [modification_masses])
+    return forward_sums[0], backward_sums[0]
+
+
+def _variant_cumulative_masses(
+    sequence: str, variant_modification_masses: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum the amino acid and modification masses of several modification variants of the same sequence at once.
+
+    See _cumulative_masses. The amino acid masses are looked up once and all variants are summed in one cumsum.
+
+    :param sequence: unmodified peptide sequence
+    :param variant_modification_masses: the modification mass of each amino acid of the sequence for each variant
+    :return: forward and backward sums after each amino acid (neutral charge), one row per variant
+    """
+    number_of_variants = len(variant_modification_masses)
+    summands = np.empty((number_of_variants, len(sequence), 2))
+    summands[:, :, 0] = _amino_acid_masses(sequence)
+    summands[:, :, 1] = variant_modification_masses
+    forward_sums = np.cumsum(summands.reshape(number_of_variants, -1), axis=1)[:, 1::2]
+    backward_sums = np.cumsum(summands[:, ::-1].reshape(number_of_variants, -1), axis=1)[:, 1::2]
+    return forward_sums, backward_sums
+
+
+def _fragment_mz_kernel(
+    forward_sums: np.ndarray,
+    backward_sums: np.ndarray,
+    ion_type_offsets: List[float],
+    max_charge: int,
+    noncl_xl: bool,
+    xl_pos: int,
+    peptide_beta_mass: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the m/z of all b and y ions in all charge states from the cumulative amino acid masses.
+
+    All returned arrays are flat and ordered by position, then charge, then ion type.
+
+    :param forward_sums: sums over the amino acids from left to right (neutral charge)
+    :param backward_sums: sums over the amino acids from right to left (neutral charge)
+    :param ion_type_offsets: the mass offsets of the b and the y ions
+    :param max_charge: the highest charge state of the fragments
+    :param noncl_xl: whether the function is called with a non-cleavable xl modification
+    :param xl_pos: the position of the crosslinker for non-cleavable XL
+    :param peptide_beta_mass: the mass of the second peptide to be considered for non-cleavable XL
+    :return: the m/z, ion type ids (0 for b and 1 for y ions), fragment numbers and charges of all fragments
+    """
+    peptide_length = len(forward_sums)
+    # ion masses of shape (peptide_length, 2) with columns b ion, y ion
+    ion_type_masses = np.empty((peptide_length, 2))
+    ion_type_masses[:, 0] = forward_sums + ion_type_offsets[0]
+    ion_type_masses[:, 1] = backward_sums + ion_type_offsets[1]
+    if noncl_xl:
+        positions = np.arange(peptide_length)
+        ion_type_masses[positions + 1 >= xl_pos, 0] += peptide_beta_mass
+        ion_type_masses[positions >= peptide_length - xl_pos, 1] += peptide_beta_mass
+
+    # positive charge is introduced by protons (or H - ELECTRON_MASS)
+    charges, charge_deltas, ion_type_ids, numbers, fragment_charges = _fragment_layout(peptide_length, max_charge)
+    mz = ((ion_type_masses[:, None, :] + charge_deltas) / charges).ravel()
+    return mz, ion_type_ids, numbers, fragment_charges
+
+
+@lru_cache(maxsize=256)
+def _fragment_layout(
+    peptide_length: int, max_charge: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the arrays of _fragment_mz_kernel that only depend on the peptide length and the highest charge.
+
+    Peptides mostly have a few common lengths, so these are built once per length and charge and reused for all
+    peptides. The arrays are read-only, since they are shared between calls.
+
+    :param peptide_length: the number of amino acids of the peptide
+    :param max_charge: the highest charge state of the fragments
+    :return: the charges and the masses of their protons as column vectors, and the flat ion type ids, fragment
+        numbers and charges of all fragments ordered by position, then charge, then ion type
+    """
+    charges = np.arange(constants.MIN_CHARGE, max_charge + 1)[:, None]
+    charge_deltas = charges * _PROTON
+
+    shape = (peptide_length, len(charges), 2)
+    ion_type_ids = np.broadcast_to(np.array([_B_ION, _Y_ION], dtype=np.int8), shape).ravel()
+    numbers = np.broadcast_to(np.arange(1, peptide_length + 1)[:, None, None], shape).ravel()
+    fragment_charges = np.broadcast_to(charges, shape).ravel()
+
+    layout = (charges, charge_deltas, ion_type_ids, numbers, fragment_charges)
+    for array in layout:
+        array.flags.writeable = False
+    return layout
+
+
+def initialize_peaks_batch(
+    sequences: List[str],
+    mass_analyzer: str,
+    charges: List[int],
+    mass_tolerance: Optional[float] = None,
+    unit_mass_tolerance: Optional[str] = None,
+) -> List[Tuple[List[dict], int, str, float]]:
+    """
+    Generate theoretical peaks for many modified peptide sequences at once.
+
+    The masses of all peptides are summed and converted to m/z in a padded matrix with one row per peptide,
+    so the numpy overhead is paid once per batch instead of once per peptide. The results are the same as
+    calling initialize_peaks for each sequence and charge. Non-cleavable XL is not supported.
+
+    :param sequences: Modified peptide sequences
+    :param mass_analyzer: Type of mass analyzer used eg. FTMS, ITMS
+    :param charges: Precursor charge of each sequence
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :raises ValueError: if the number of charges does not match the number of sequences
+    :return: List with the result of initialize_peaks for each sequence
+    """
+    if len(sequences) != len(charges):
+        raise ValueError(f"Expected one charge per sequence. Given: {len(sequences)} sequences, {len(charges)} charges")
+    if len(sequences) == 0:
+        return []
+
+    modification_masses, n_term_mods, peptide_sequences = zip(*map(_get_modification_masses, sequences))
+    forward_sums, backward_sums, lengths = _batch_cumulative_masses(peptide_sequences, modification_masses)
+    batch_size, max_length = forward_sums.shape
+
+    ion_type_masses = np.empty((batch_size, max_length, 2))
+    ion_type_masses[:, :, 0] = forward_sums + _ION_TYPE_OFFSETS[0]
+    ion_type_masses[:, :, 1] = backward_sums + _ION_TYPE_OFFSETS[1]
+    ion_charges, charge_deltas, ion_type_ids, numbers, fragment_charges = _fragment_layout(max_length, 3)
+    mz = ((ion_type_masses[:, :, None, :] + charge_deltas) / ion_charges).reshape(batch_size, -1)
+
+    # padded positions and charges above the precursor charge (at most 3) are sorted to the end of each row
+    max_charges = np.minimum(3, np.asarray(charges))
+    valid = (numbers <= lengths[:, None]) & (fragment_charges <= max_charges[:, None])
+    order = np.argsort(np.where(valid, mz, np.inf), axis=1, kind="stable")
+    mz = np.take_along_axis(mz, order, axis=1)
+    min_mz, max_mz = get_min_max_mass_batch(mass_analyzer, mz, mass_tolerance, unit_mass_tolerance)
+
+    # the sum of each whole peptide, with a leading column of zeros for empty sequences
+    peptide_sums = np.hstack([np.zeros((batch_size, 1)), forward_sums])[np.arange(batch_size), lengths]
+    peptide_masses = peptide_sums + _ION_TYPE_OFFSETS[0] + _ION_TYPE_OFFSETS[1]
+
+    results = []
+    for row, number_of_fragments in enumerate(valid.sum(axis=1).tolist()):
+        fragment_order = order[row, :number_of_fragments]
+        fragment_columns = {
+            "ion_type": ion_type_ids[fragment_order],
+            "no": numbers[fragment_order],
+            "charge": fragment_charges[fragment_order],
+            "mass": mz[row, :number_of_fragments],
+            "min_mass": min_mz[row, :number_of_fragments],
+            "max_mass": max_mz[row, :number_of_fragments],
+        }
+        results.append(
+            (
+                _to_records(fragment_columns),
+                n_term_mods[row],
+                peptide_sequences[row],
+                float(peptide_masses[row]),
+            )
+        )
+    return results
+
+
+def _batch_cumulative_masses(
+    sequences: Tuple[str, ...], modification_masses: Tuple[np.ndarray, ...]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sum the amino acid and modification masses of many peptides in a matrix padded to the longest peptide.
 
-    return mass
+    See _cumulative_masses. The padding is zero, so it does not change any sum. The backward sums are summed
+    over the reversed rows, which start with the padding, and are shifted back to the start of each row.
+
+    :param sequences: unmodified peptide sequences
+    :param modification_masses: the modification mass of each amino acid of each peptide
+    :return: forward and backward sums after each amino acid (neutral charge), one row per peptide, and the
+        lengths of the peptides
+    """
+    lengths = np.fromiter(map(len, sequences), dtype=np.intp, count=len(sequences))
+    batch_size, max_length = len(sequences), int(lengths.max())
+    summands = np.zeros((batch_size, max_length, 2))
+    residues = np.arange(max_length) < lengths[:, None]
+    summands[residues, 0] = _amino_acid_masses("".join(sequences))
+    summands[residues, 1] = np.concatenate(modification_masses)
+
+    forward_sums = np.cumsum(summands.reshape(batch_size, -1), axis=1)[:, 1::2]
+    backward_sums = np.cumsum(summands[:, ::-1].reshape(batch_size, -1), axis=1)[:, 1::2]
+    shifted = np.minimum((max_length - lengths)[:, None] + np.arange(max_length), max_length - 1)
+    return forward_sums, np.take_along_axis(backward_sums, shifted, axis=1), lengths
 
 
 def initialize_peaks_xl(
@@ -208,8 +563,6 @@ def initialize_peaks_xl(
     :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
     :param sequence_beta: optional second peptide to be considered for non-cleavable XL
     :raises ValueError: if crosslinker_type is unkown
-    :raises AssertionError: if the short and long XL sequence (the one with the short / long crosslinker mod)
-        has a tmt n term while the other one does not
     :return: List of theoretical peaks, flag to indicate if there is a tmt on n-terminus, unmodified peptide
         sequence, therotical mass of modified peptide (without considering mass of crosslinker)
     """
@@ -233,39 +586,13 @@ def initialize_peaks_xl(
             sequence_l = sequence.replace(dsbu, dsbu_l)
             sequence_without_crosslinker = sequence.replace(dsbu, "")
 
-        # TODO: this needs to be done more efficiently:
-        # currently calculating the non-cleaved part until the xl_pos of the ions two times!
-        # also the peptide sequence, mass and modifications are called twice
-        # need to separate all of these functions better!
-        # for XL, we actually don't need mass_s / mass_l at the moment because only one mass, without
+        # TODO: for XL, we actually don't need mass_s / mass_l at the moment because only one mass, without
         # the crosslinker is returned! This needs to be fixed, because mass is used as CALCULATED_MASS in
         # percolator!
 
-        list_out_s, tmt_n_term_s, peptide_sequence, _ = initialize_peaks(
-            sequence_s, mass_analyzer, charge, mass_tolerance, unit_mass_tolerance
-        )
-        list_out_l, tmt_n_term_l, peptide_sequence, _ = initialize_peaks(
-            sequence_l, mass_analyzer, charge, mass_tolerance, unit_mass_tolerance
+        fragment_columns, tmt_n_term, peptide_sequence = _initialize_peak_columns_xl_variants(
+            sequence_s, sequence_l, crosslinker_position, mass_analyzer, charge, mass_tolerance, unit_mass_tolerance
         )
-
-        tmt_n_term = tmt_n_term_s
-        if tmt_n_term_s ^ tmt_n_term_l:
-            raise AssertionError("tmt_mod is {tmt_n_term_s} for short sequence but {tmt_n_term_l} for long sequence!")
-
-        df_out_s = pd.DataFrame(list_out_s)
-        df_out_l = pd.DataFrame(list_out_l)
-
-        threshold_b = crosslinker_position
-        threshold_y = len(peptide_sequence) - crosslinker_position + 1
-
-        df_out_s.loc[(df_out_s["no"] >= threshold_b) & (df_out_s["ion_type"] == "b"), "ion_type"] = "b-short"
-        df_out_s.loc[(df_out_s["no"] >= threshold_y) & (df_out_s["ion_type"] == "y"), "ion_type"] = "y-short"
-        df_out_l.loc[(df_out_l["no"] >= threshold_b) & (df_out_l["ion_type"] == "b"), "ion_type"] = "b-long"
-        df_out_l.loc[(df_out_l["no"] >= threshold_y) & (df_out_l["ion_type"] == "y"), "ion_type"] = "y-long"
-
-        concatenated_df = pd.concat([df_out_s, df_out_l])
-        unique_df = concatenated_df.drop_duplicates()  # TODO: this is where the duplicate calculations are removed
-        df_out = unique_df.sort_values("mass")
         mass = compute_peptide_mass(sequence_without_crosslinker)
 
     elif crosslinker_type in ["BS3", "DSS"]:  # non-cleavable XL
@@ -279,7 +606,7 @@ def initialize_peaks_xl(
         sequence_mass = compute_peptide_mass(sequence_without_crosslinker)
         sequence_beta_mass = compute_peptide_mass(sequence_beta_without_crosslinker)
 
-        list_out, tmt_n_term, peptide_sequence, _ = initialize_peaks(
+        columns, tmt_n_term, peptide_sequence, _ = _initialize_peak_columns(
             sequence,
             mass_analyzer,
             charge,
@@ -289,23 +616,105 @@ def initialize_peaks_xl(
             sequence_beta_mass if sequence_beta_mass is not None else None,
             crosslinker_position,
         )
-        df_out = pd.DataFrame(list_out)
-
         threshold_b_alpha = crosslinker_position
         threshold_y_alpha = len(peptide_sequence) - crosslinker_position + 1
 
-        df_out.loc[(df_out["no"] >= threshold_b_alpha) & (df_out["ion_type"] == "b"), "ion_type"] = "b-xl"
-        df_out.loc[(df_out["no"] >= threshold_y_alpha) & (df_out["ion_type"] == "y"), "ion_type"] = "y-xl"
-
-        df_out = df_out.sort_index()
-        unique_df = df_out.drop_duplicates()
-        df_out = unique_df.sort_values("mass")
+        # the peaks of a single sequence are unique, no need to drop duplicates
+        _label_xl_fragments(columns, threshold_b_alpha, threshold_y_alpha, "xl")
+        fragment_columns = _sort_peaks(columns)
         mass = sequence_mass
 
     else:
         raise ValueError(f"Unkown crosslinker type: {crosslinker_type}")
 
-    return df_out.to_dict(orient="records"), tmt_n_term, peptide_sequence, mass
+    return _to_records(fragment_columns), tmt_n_term, peptide_sequence, mass
+
+
+def _initialize_peak_columns_xl_variants(
+    sequence_s: str,
+    sequence_l: str,
+    crosslinker_position: int,
+    mass_analyzer: str,
+    charge: int,
+    mass_tolerance: Optional[float] = None,
+    unit_mass_tolerance: Optional[str] = None,
+) -> Tuple[Dict[str, np.ndarray], int, str]:
+    """
+    Generate theoretical peaks for the short and the long variant of a cleavable crosslinked peptide sequence.
+
+    Both variants are summed in one pass. The fragments without the crosslinker are the same for both variants,
+    so they are only taken from the short variant and only the fragments containing the crosslinker are added
+    from the long variant.
+
+    :param sequence_s: Modified peptide sequence with the short crosslinker modification
+    :param sequence_l: Modified peptide sequence with the long crosslinker modification
+    :param crosslinker_position: The position of crosslinker
+    :param mass_analyzer: Type of mass analyzer used eg. FTMS, ITMS
+    :param charge: Precursor charge
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :raises AssertionError: if the short and long XL sequence (the one with the short / long crosslinker mod)
+        has a tmt n term while the other one does not
+    :return: Columns of theoretical peaks sorted by mass, flag to indicate if there is a tmt on n-terminus,
+        unmodified peptide sequence
+    """
+    modification_masses_s, tmt_n_term_s, peptide_sequence = _get_modification_masses(sequence_s)
+    modification_masses_l, tmt_n_term_l, _ = _get_modification_masses(sequence_l)
+    if tmt_n_term_s ^ tmt_n_term_l:
+        raise AssertionError("tmt_mod is {tmt_n_term_s} for short sequence but {tmt_n_term_l} for long sequence!")
+
+    forward_sums, backward_sums = _variant_cumulative_masses(
+        peptide_sequence, [modification_masses_s, modification_masses_l]
+    )
+    max_charge = min(3, charge)
+    columns_s = _peak_columns(
+        forward_sums[0], backward_sums[0], mass_analyzer, max_charge, mass_tolerance, unit_mass_tolerance
+    )
+    columns_l = _peak_columns(
+        forward_sums[1], backward_sums[1], mass_analyzer, max_charge, mass_tolerance, unit_mass_tolerance
+    )
+
+    threshold_b = crosslinker_position
+    threshold_y = len(peptide_sequence) - crosslinker_position + 1
+    _label_xl_fragments(columns_s, threshold_b, threshold_y, "short")
+    _label_xl_fragments(columns_l, threshold_b, threshold_y, "long")
+
+    crosslinked = columns_l["ion_type"] > _Y_ION
+    fragment_columns = {name: np.concatenate([columns_s[name], columns_l[name][crosslinked]]) for name in columns_s}
+    return _sort_peaks(fragment_columns), tmt_n_term_s, peptide_sequence
+
+
+def _label_xl_fragments(
+    fragment_columns: Dict[str, np.ndarray], threshold_b: int, threshold_y: int, suffix: str
+) -> None:
+    """
+    Relabel the fragments containing the crosslinker in place, e.g. b to b-short, by changing their ion type ids.
+
+    :param fragment_columns: columns of theoretical peaks as returned by _initialize_peak_columns
+    :param threshold_b: the lowest number of a b ion containing the crosslinker
+    :param threshold_y: the lowest number of a y ion containing the crosslinker
+    :param suffix: the suffix added to the ion type, one of short, long or xl
+    """
+    ion_type = fragment_columns["ion_type"].copy()
+    numbers = fragment_columns["no"]
+    offset = _XL_ION_TYPE_OFFSETS[suffix]
+    ion_type[(numbers >= threshold_b) & (ion_type == _B_ION)] = _B_ION + offset
+    ion_type[(numbers >= threshold_y) & (ion_type == _Y_ION)] = _Y_ION + offset
+    fragment_columns["ion_type"] = ion_type
+
+
+def _sort_peaks(fragment_columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Sort theoretical peaks by mass.
+
+    The default quicksort of np.argsort is the same sort pandas sort_values uses for a single column, so peaks
+    with the same mass, e.g. the short and long variant of a fragment, stay in the established order.
+
+    :param fragment_columns: columns of theoretical peaks
+    :return: columns of the peaks sorted by mass
+    """
+    order = np.argsort(fragment_columns["mass"])
+    return {name: column[order] for name, column in fragment_columns.items()}
 
 
 def get_min_max_mass(
@@ -322,36 +731,102 @@ def get_min_max_mass(
     - TOF: +/- 40 ppm
     - ITMS: +/- 0.35 daltons
 
+    A ValueError is raised if the mass_analyzer is other than one of FTMS, TOF, ITMS or the unit_mass_tolerance is
+    other than one of ppm, da.
+
     :param mass_tolerance: mass tolerance to calculate min and max mass
     :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
     :param mass_analyzer: the type of mass analyzer used to determine the tolerance.
     :param mass: the theoretical fragment mass
+    :return: a tuple (min, max) denoting the mass tolerance range.
+    """
+    return _apply_mass_tolerance(mass, *_resolve_mass_tolerance(mass_analyzer, mass_tolerance, unit_mass_tolerance))
+
+
+def get_min_max_mass_batch(
+    mass_analyzer: str,
+    masses: np.ndarray,
+    mass_tolerance: Optional[float] = None,
+    unit_mass_tolerance: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the min and max masses of many fragment masses at once.
+
+    The tolerance is resolved once for all masses, see get_min_max_mass for the defaults of the mass analyzers.
+
+    :param mass_analyzer: the type of mass analyzer used to determine the tolerance.
+    :param masses: the theoretical fragment masses
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :return: arrays of the min and max masses with the same shape as masses
+    """
+    masses = np.asarray(masses, dtype=np.float64)
+    return _apply_mass_tolerance(masses, *_resolve_mass_tolerance(mass_analyzer, mass_tolerance, unit_mass_tolerance))
+
+
+def _resolve_mass_tolerance(
+    mass_analyzer: str, mass_tolerance: Optional[float], unit_mass_tolerance: Optional[str]
+) -> Tuple[float, str]:
+    """
+    Get the mass tolerance and its unit, falling back to the default tolerance of the mass analyzer.
+
+    :param mass_analyzer: the type of mass analyzer used to determine the tolerance.
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
     :raises ValueError: if mass_analyzer is other than one of FTMS, TOF, ITMS
     :raises ValueError: if unit_mass_tolerance is other than one of ppm, da
-
-    :return: a tuple (min, max) denoting the mass tolerance range.
+    :return: the mass tolerance and its unit
     """
     if mass_tolerance is not None and unit_mass_tolerance is not None:
-        if unit_mass_tolerance == "ppm":
-            min_mass = (mass * -mass_tolerance / 1000000) + mass
-            max_mass = (mass * mass_tolerance / 1000000) + mass
-        elif unit_mass_tolerance == "da":
-            min_mass = mass - mass_tolerance
-            max_mass = mass + mass_tolerance
-        else:
+        if unit_mass_tolerance not in ("ppm", "da"):
             raise ValueError(f"Unsupported unit for the mass tolerance: {unit_mass_tolerance}")
-    elif mass_analyzer == "FTMS":
-        min_mass = (mass * -20 / 1000000) + mass
-        max_mass = (mass * 20 / 1000000) + mass
-    elif mass_analyzer == "TOF":
-        min_mass = (mass * -40 / 1000000) + mass
-        max_mass = (mass * 40 / 1000000) + mass
-    elif mass_analyzer == "ITMS":
-        min_mass = mass - 0.35
-        max_mass = mass + 0.35
-    else:
-        raise ValueError(f"Unsupported mass_analyzer: {mass_analyzer}")
-    return (min_mass, max_mass)
+        return mass_tolerance, unit_mass_tolerance
+    if mass_analyzer == "FTMS":
+        return 20, "ppm"
+    if mass_analyzer == "TOF":
+        return 40, "ppm"
+    if mass_analyzer == "ITMS":
+        return 0.35, "da"
+    raise ValueError(f"Unsupported mass_analyzer: {mass_analyzer}")
+
+
+def _apply_mass_tolerance(mass, mass_tolerance: float, unit_mass_tolerance: str):
+    """
+    Get the min and max mass within the given tolerance.
+
+    :param mass: the theoretical fragment mass or an array of masses
+    :param mass_tolerance: mass tolerance to calculate min and max mass
+    :param unit_mass_tolerance: unit for the mass tolerance (da or ppm)
+    :return: a tuple (min, max) denoting the mass tolerance range.
+    """
+    if unit_mass_tolerance == "ppm":
+        return (mass * -mass_tolerance / 1000000) + mass, (mass * mass_tolerance / 1000000) + mass
+    return mass - mass_tolerance, mass + mass_tolerance
+
+
+def residue_masses(seq_int: np.ndarray) -> np.ndarray:
+    """
+    Get the residue masses of an integer encoded sequence with a single lookup in constants.VEC_MZ.
+
+    :param seq_int: integer encoded sequence(s) using the values of constants.ALPHABET, 0 is padding
+    :return: array of residue masses with the same shape as seq_int, padding has mass 0
+    """
+    return constants.VEC_MZ[np.asarray(seq_int, dtype=np.intp)]
+
+
+def prefix_masses(seq_int: np.ndarray) -> np.ndarray:
+    """
+    Get the cumulative residue masses of an integer encoded sequence along its last axis.
+
+    The b ion neutral mass at position i is prefix[i] + N_TERMINUS - H. With L being the number of non-padding
+    residues and total = prefix[L - 1], the y ion neutral mass of the last i + 1 residues is
+    total - prefix[L - i - 2] + C_TERMINUS + H. Indexing from the end, i.e. prefix[-i - 2], is only correct
+    without padding. No intermediate subsequences are built.
+
+    :param seq_int: integer encoded sequence(s) using the values of constants.ALPHABET, 0 is padding
+    :return: array of cumulative residue masses with the same shape as seq_int
+    """
+    return np.cumsum(residue_masses(seq_int), axis=-1)
 
 
 def compute_ion_masses(seq_int: List[int], charge_onehot: List[int], tmt: str = "") -> Optional[np.ndarray]:
@@ -374,88 +849,65 @@ def compute_ion_masses(seq_int: List[int], charge_onehot: List[int], tmt: str =
         print(f"[ERROR] Sequence length {len(seq_int)} is not desired length of {constants.SEQ_LEN}")
         return None
 
-    idx = list(seq_int).index(0) if 0 in seq_int else constants.SEQ_LEN
-    masses = np.ones((constants.SEQ_LEN - 1) * 2 * 3, dtype=np.float32) * -1
-    mass_b = 0
-    mass_y = 0
-    j = 0  # iterate over masses
-
-    # Iterate over sequence, sequence should have length 30
-    for i in range(idx - 1):  # only 29 possible ions
-        j = i * 6  # index for masses array at position
-
-        # MASS FOR Y IONS
-        # print("Added", constants.VEC_MZ[seq_int[l-1-i]])
-        mass_y += constants.VEC_MZ[seq_int[idx - 1 - i]]
-
-        # Compute charge +1
-        masses[j] = (
-            mass_y
-            + 1 * constants.PARTICLE_MASSES["PROTON"]
-            + constants.MASSES["C_TERMINUS"]
-            + constants.ATOM_MASSES["H"]
-        ) / 1.0
-        # Compute charge +2
-        masses[j + 1] = (
-            (
-                mass_y
-                + 2 * constants.PARTICLE_MASSES["PROTON"]
-                + constants.MASSES["C_TERMINUS"]
-                + constants.ATOM_MASSES["H"]
-            )
-            / 2.0
-            if charge >= 2
-            else -1.0
-        )
-        # Compute charge +3
-        masses[j + 2] = (
-            (
-                mass_y
-                + 3 * constants.PARTICLE_MASSES["PROTON"]
-                + constants.MASSES["C_TERMINUS"]
-                + constants.ATOM_MASSES["H"]
-            )
-            / 3.0
-            if charge >= 3.0
-            else -1.0
-        )
+    seq_arr = np.asarray(seq_int, dtype=np.intp)
+    # the codes are positive and padding is 0, so the first minimum is the start of the padding if there is any
+    idx = int(seq_arr.argmin())
+    if seq_arr[idx] != 0:
+        idx = constants.SEQ_LEN
+    residues = constants.VEC_MZ[seq_arr[:idx]]
+    if tmt != "" and idx > 0:
+        residues[0] += constants.MOD_MASSES[constants.TMT_MODS[tmt]]
+
+    # rows are the positions, columns y1+, y2+, y3+, b1+, b2+, b3+, cumsum adds the residues one by one like a loop
+    masses = np.full((constants.SEQ_LEN - 1, 6), -1.0, dtype=np.float32)
+    number_of_ions = max(idx - 1, 0)
+    masses[:number_of_ions, :3] = (
+        np.cumsum(residues[::-1])[:number_of_ions, None] + _ION_PROTON_MASSES + constants.MASSES["C_TERMINUS"] + _H
+    ) / _ION_CHARGES
+    masses[:number_of_ions, 3:] = (
+        np.cumsum(residues)[:number_of_ions, None] + _ION_PROTON_MASSES + constants.MASSES["N_TERMINUS"] - _H
+    ) / _ION_CHARGES
+    masses[:, _ION_COLUMN_CHARGES > charge] = -1.0
+    return masses.ravel()
+
+
+def compute_ion_masses_batch(seq_int: np.ndarray, charges: np.ndarray, tmt: str = "") -> np.ndarray:
+    """
+    Compute the ion masses of a batch of integer encoded sequences at once.
 
-        # MASS FOR B IONS
-        if i == 0 and tmt != "":
-            mass_b += constants.VEC_MZ[seq_int[i]] + constants.MOD_MASSES[constants.TMT_MODS[tmt]]
-        else:
-            mass_b += constants.VEC_MZ[seq_int[i]]
-
-        # Compute charge +1
-        masses[j + 3] = (
-            mass_b
-            + 1 * constants.PARTICLE_MASSES["PROTON"]
-            + constants.MASSES["N_TERMINUS"]
-            - constants.ATOM_MASSES["H"]
-        ) / 1.0
-        # Compute charge +2
-        masses[j + 4] = (
-            (
-                mass_b
-                + 2 * constants.PARTICLE_MASSES["PROTON"]
-                + constants.MASSES["N_TERMINUS"]
-                - constants.ATOM_MASSES["H"]
-            )
-            / 2.0
-            if charge >= 2
-            else -1.0
-        )
-        # Compute charge +3
-        masses[j + 5] = (
-            (
-                mass_b
-                + 3 * constants.PARTICLE_MASSES["PROTON"]
-                + constants.MASSES["N_TERMINUS"]
-                - constants.ATOM_MASSES["H"]
-            )
-            / 3.0
-            if charge >= 3.0
-            else -1.0
-        )
+    Every row gives the same result as compute_ion_masses. The b and y ion masses are cumulative sums over the
+    residue masses, which add up the residues in the same order as the loop in compute_ion_masses.
 
-    return masses
+    :param seq_int: integer encoded sequences of shape (number of sequences, SEQ_LEN), padded with 0
+    :param charges: precursor charges of the sequences
+    :param tmt: the tmt tag added to the first residue, one of the keys of constants.TMT_MODS or "" for no tag
+    :raises ValueError: if the sequences are not of length SEQ_LEN
+    :return: float32 array of shape (number of sequences, VEC_LENGTH) with the ion masses, invalid masses are -1
+    """
+    seq_int = np.asarray(seq_int, dtype=np.intp)
+    if seq_int.ndim != 2 or seq_int.shape[1] != constants.SEQ_LEN:
+        raise ValueError(f"Sequences must be of shape (n, {constants.SEQ_LEN}). Given: {seq_int.shape}")
+    charges = np.asarray(charges).reshape(-1, 1, 1)
+
+    positions = np.arange(constants.SEQ_LEN)
+    padding = seq_int == 0
+    lengths = np.where(padding.any(axis=1), padding.argmax(axis=1), constants.SEQ_LEN)
+
+    residues = residue_masses(seq_int)
+    residues[positions >= lengths[:, None]] = 0.0  # ignore everything after the first padding
+    if tmt != "":
+        residues[:, 0] += constants.MOD_MASSES[constants.TMT_MODS[tmt]]
+
+    mass_b = np.cumsum(residues, axis=1)[:, :-1]
+    # the reversed rows start with the padding, which adds exact zeros before the last residue
+    suffix_indices = np.minimum(constants.SEQ_LEN - lengths[:, None] + positions[:-1], constants.SEQ_LEN - 1)
+    mass_y = np.take_along_axis(np.cumsum(residues[:, ::-1], axis=1), suffix_indices, axis=1)
+
+    y_ions = (mass_y[:, :, None] + _ION_PROTON_MASSES + constants.MASSES["C_TERMINUS"] + _H) / _ION_CHARGES
+    b_ions = (mass_b[:, :, None] + _ION_PROTON_MASSES + constants.MASSES["N_TERMINUS"] - _H) / _ION_CHARGES
+    masses = np.concatenate([y_ions, b_ions], axis=2).astype(np.float32)
+
+    invalid_positions = (positions[:-1] >= lengths[:, None] - 1)[:, :, None]
+    invalid_charges = _ION_COLUMN_CHARGES > charges
+    masses[invalid_positions | invalid_charges] = -1.0
+    return masses.reshape(len(seq_int), constants.VEC_LENGTH)
@@ -54,7 +54,8 @@ class FragmentsRatio(Metric):
         if ion_mask is None:
             ion_mask = scipy.sparse.csr_matrix(np.ones((array_size, 1)))
         else:
-            ion_mask = scipy.sparse.csr_matrix(ion_mask).T
+            # count in int64, the uint8 ion masks of constants would otherwise limit the counts to 255
+            ion_mask = scipy.sparse.csr_matrix(ion_mask, dtype=np.int64).T
         return scipy.sparse.csr_matrix.dot(boolean_array, ion_mask).toarray().flatten()
 
     @staticmethod
@@ -1,10 +1,13 @@
 from abc import abstractmethod
+from pathlib import Path
 from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
 import scipy.sparse
 
+_FILE_FORMATS_BY_SUFFIX = {".parquet": "parquet", ".feather": "feather"}
+
 
 class Metric:
     """Main to init a Metric obj."""
@@ -41,6 +44,33 @@ class Metric:
         """Calculate."""
         pass
 
-    def write_to_file(self, file_path: str):
-        """Write to file_path."""
-        self.metrics_val.to_csv(file_path, sep="\t", index=False)
+    def write_to_file(self, file_path: Union[str, Path], file_format: Optional[str] = None):
+        """
+        Write the metrics to file_path.
+
+        Parquet and feather are columnar binary formats, which are much faster to write and read and smaller on disk
+        than a tab separated text file for large tables. Both need pyarrow (or fastparquet for parquet) installed,
+        which is available via the optional parquet extra of this package.
+
+        :param file_path: path of the output file
+        :param file_format: one of tsv, parquet or feather. If None, it is inferred from the file extension
+            (.parquet, .feather), and tsv is used for any other extension.
+        :raises ValueError: if the file_format is not supported
+        :raises ImportError: if parquet or feather is requested, but pyarrow (or fastparquet) is not installed
+        """
+        if file_format is None:
+            file_format = _FILE_FORMATS_BY_SUFFIX.get(Path(file_path).suffix.lower(), "tsv")
+        if file_format == "tsv":
+            self.metrics_val.to_csv(file_path, sep="\t", index=False)
+        elif file_format in ("parquet", "feather"):
+            try:
+                if file_format == "parquet":
+                    self.metrics_val.to_parquet(file_path, compression="snappy", index=False)
+                else:
+                    self.metrics_val.reset_index(drop=True).to_feather(file_path)
+            except ImportError as e:
+                raise ImportError(
+                    f"Writing {file_format} files requires pyarrow, install it with the parquet extra."
+                ) from e
+        else:
+            raise ValueError(f"Unsupported file format: {file_format}. Supported are tsv, parquet and feather.")
@@ -1,7 +1,8 @@
 import difflib
 import re
-from itertools import combinations, repeat
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache, partial
+from itertools import combinations, islice, repeat
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -16,6 +17,60 @@ from .constants import (
     XISEARCH_VAR_MODS,
 )
 
+# all keys of SPECTRONAUT_MODS, MOD_MASSES and MOD_NAMES are bracketed tokens, e.g. [UNIMOD:4], so instead of
+# an alternation over all keys, which is tried key by key at every position, a single pass over the bracketed
+# tokens followed by a dict lookup finds all of them. Tokens that are not in the table are kept as is.
+# [^\[\]\n]* consumes the bracket content in a single step instead of the lazy .*? which checks for ] after each char.
+# it neither crosses an opening bracket nor the newline joining a batch, so an unclosed [ of a malformed sequence
+# cannot swallow the tokens of the next sequence. The token is captured, so that re.split keeps the tokens at the
+# odd positions of the result
+_MOD_TOKEN_RE = re.compile(r"(\[[^\[\]\n]*\])")
+# internal_without_mods removes everything from an opening to the next closing bracket, like \[.*?\] did
+_MOD_STRIP_RE = re.compile(r"\[[^\]]*\]")
+# replacement strings for internal_to_mod_mass, formatted once instead of per match
+_MOD_MASS_STRINGS = {key: f"[+{mass}]" for key, mass in MOD_MASSES.items()}
+# number of sequences parse_modstrings translates with a single lookup before yielding them
+_TRANSLATE_CHUNK_SIZE = 4096
+
+# translation tables to escape only one kind of brackets in MaxQuant / MSFragger keys, which may contain regex syntax
+_ESCAPE_PARENTHESES = str.maketrans({"(": r"\(", ")": r"\)"})
+_ESCAPE_SQUARE_BRACKETS = str.maketrans({"[": r"\[", "]": r"\]"})
+# translation table to replace all lower case tagged amino acids of proteomicsdb sequences in a single pass
+_PROTEOMICSDB_TAGGED_MODS = str.maketrans(
+    {
+        "m": "M[UNIMOD:35]",
+        "c": "C[UNIMOD:4]",
+        "k": "K[UNIMOD:737]",
+        "s": "S[UNIMOD:21]",
+        "t": "T[UNIMOD:21]",
+        "y": "Y[UNIMOD:21]",
+    }
+)
+
+
+def _replace_mod_tokens(sequences: Iterable[str], replacements: Dict[str, str]) -> List[str]:
+    """
+    Replace the bracketed mod tokens of all sequences, keeping tokens that are not in replacements.
+
+    The sequences are joined and split at the tokens once for the whole batch. Tokens are then looked up with
+    map(dict.get, ...), so no python callback is executed per match or per sequence.
+
+    :param sequences: the sequences to translate
+    :param replacements: dictionary with the tokens to replace as keys
+    :return: list of translated sequences
+    """
+    sequences = list(sequences)
+    if not sequences:
+        return []
+    parts = _MOD_TOKEN_RE.split("\n".join(sequences))
+    tokens = parts[1::2]
+    parts[1::2] = map(replacements.get, tokens, tokens)
+    translated = "".join(parts).split("\n")
+    if len(translated) != len(sequences):  # a sequence contained the separator, translate one by one instead
+        replacement_func = lambda match: replacements.get(match.group(), match.group())
+        return [_MOD_TOKEN_RE.sub(replacement_func, seq) for seq in sequences]
+    return translated
+
 
 def sage_to_internal(sequences: List[str]) -> List[str]:
     """
@@ -125,8 +180,85 @@ def internal_to_spectronaut(sequences: Union[np.ndarray, pd.Series, List[str]])
     :param sequences: List[str] of sequences
     :return: List[str] of modified sequences
     """
-    regex = re.compile("(%s)" % "|".join(map(re.escape, SPECTRONAUT_MODS.keys())))
-    return [regex.sub(lambda mo: SPECTRONAUT_MODS[mo.string[mo.start() : mo.end()]], seq) for seq in sequences]
+    return _replace_mod_tokens(sequences, SPECTRONAUT_MODS)
+
+
+def _split_maxquant_replacements(replacements: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """
+    Split MaxQuant replacements into n-terminal, c-terminal and body replacements.
+
+    Terminal keys are identified by the leading / trailing '_' of MaxQuant sequences. Anchors ('^_', '_$') are
+    removed from the keys, since the terminal regexes are anchored themselves.
+
+    :param replacements: dictionary of all replacements
+    :return: tuple of the n-terminal, c-terminal and body replacements
+    """
+    term_n, term_c, body = {}, {}, {}
+    for key, value in replacements.items():
+        if key.startswith("^_"):
+            term_n[key[1:]] = value
+        elif key.endswith("_$"):
+            term_c[key[:-1]] = value
+        elif key.startswith("_"):
+            term_n[key] = value
+        elif key.endswith("_"):
+            term_c[key] = value
+        else:
+            body[key] = value
+    return term_n, term_c, body
+
+
+@lru_cache(maxsize=None)
+def _maxquant_translator(fixed_mods: Tuple[Tuple[str, str], ...]) -> Callable[[str], str]:
+    """
+    Build a translator from the MaxQuant to the internal modstring format for the given fixed modifications.
+
+    Replacements are split into n-terminal, c-terminal and body modifications, each with its own
+    precompiled regex. Terminal modifications are resolved once per sequence using anchored regexes, so
+    the body regex does not need to check the position of every match. The translator is cached per unique
+    set of fixed modifications, which are passed as a tuple of items to keep the order of the alternatives.
+
+    :param fixed_mods: tuple of (key, value) pairs of the fixed modifications
+    :return: function translating a single MaxQuant sequence to the internal format
+    """
+    term_n, term_c, body = _split_maxquant_replacements({**MAXQUANT_VAR_MODS, **dict(fixed_mods)})
+
+    def alternatives(replacements: Dict[str, str]) -> str:
+        """
+        Subfunction to join the escaped keys to a regex, trying longer keys first (e.g. '_(tm)' before '_').
+
+        :param replacements: dictionary of replacements
+        :return: regex alternatives for the keys of the dictionary
+        """
+        return "|".join(key.translate(_ESCAPE_PARENTHESES) for key in sorted(replacements, key=len, reverse=True))
+
+    term_n_regex = re.compile(f"^(?:{alternatives(term_n)})") if term_n else None
+    term_c_regex = re.compile(f"(?:{alternatives(term_c)})$") if term_c else None
+    body_regex = re.compile("|".join(key.translate(_ESCAPE_PARENTHESES) for key in body)) if body else None
+
+    def translate(seq: str) -> str:
+        """
+        Subfunction to translate a single sequence.
+
+        :param seq: MaxQuant sequence
+        :return: sequence in the internal format
+        """
+        prefix = suffix = ""
+        if term_n_regex is not None:
+            match = term_n_regex.match(seq)
+            if match is not None:
+                prefix = term_n[match.group()]
+                seq = seq[match.end() :]
+        if term_c_regex is not None:
+            match = term_c_regex.search(seq)
+            if match is not None:
+                suffix = term_c[match.group()]
+                seq = seq[: match.start()]
+        if body_regex is not None:
+            seq = body_regex.sub(lambda match: body[match.group()], seq)
+        return f"{prefix}{seq}{suffix}".replace("_", "")
+
+    return translate
 
 
 def maxquant_to_internal(
@@ -148,38 +280,8 @@ def maxquant_to_internal(
     err_msg = f"Provided illegal fixed mod, supported modifications are {set(MAXQUANT_VAR_MODS.values())}."
     assert all(x in MAXQUANT_VAR_MODS.values() for x in fixed_mods.values()), err_msg
 
-    replacements = {**MAXQUANT_VAR_MODS, **fixed_mods}
-
-    def custom_regex_escape(key: str) -> str:
-        """
-        Subfunction to escape only normal brackets in the modstring.
-
-        :param key: The match to escape
-        :return: match with escaped special characters
-        """
-        for k, v in {"(": r"\(", ")": r"\)"}.items():
-            key = key.replace(k, v)
-        return key
-
-    regex = re.compile("|".join(map(custom_regex_escape, replacements.keys())))
-
-    def find_replacement(match: re.Match) -> str:
-        """
-        Subfunction to find the corresponding substitution for a match.
-
-        :param match: an re.Match object found by re.sub
-        :return: substitution string for the given match
-        """
-        key = match.string[match.start() : match.end()]
-        if "_" in key:  # If _ is in the match we need to differentiate n and c term
-            if match.start() == 0:
-                key = f"^{key}"
-            else:
-                key = f"{key}$"
-
-        return replacements[key]
-
-    return [regex.sub(find_replacement, seq).replace("_", "") for seq in sequences]
+    translate = _maxquant_translator(tuple(fixed_mods.items()))
+    return [translate(seq) for seq in sequences]
 
 
 def msfragger_to_internal(
@@ -203,17 +305,6 @@ def msfragger_to_internal(
 
     replacements = {**MSFRAGGER_VAR_MODS, **fixed_mods}
 
-    def custom_regex_escape(key: str) -> str:
-        """
-        Subfunction to escape only normal brackets in the modstring.
-
-        :param key: The match to escape
-        :return: match with escaped special characters
-        """
-        for k, v in {"[": r"\[", "]": r"\]"}.items():
-            key = key.replace(k, v)
-        return key
-
     def find_replacement(match: re.Match) -> str:
         """
         Subfunction to find the corresponding substitution for a match.
@@ -221,10 +312,9 @@ def msfragger_to_internal(
         :param match: an re.Match object found by re.sub
         :return: substitution string for the given match
         """
-        key = match.string[match.start() : match.end()]
-        return replacements[key]
+        return replacements[match.group()]
 
-    regex = re.compile("|".join(map(custom_regex_escape, replacements.keys())))
+    regex = re.compile("|".join(key.translate(_ESCAPE_SQUARE_BRACKETS) for key in replacements))
 
     return [regex.sub(find_replacement, seq) for seq in sequences]
 
@@ -236,8 +326,8 @@ def internal_without_mods(sequences: List[str]) -> List[str]:
     :param sequences: List[str] of sequences
     :return: List[str] of modified sequences
     """
-    regex = r"\[.*?\]|\-"
-    return [re.sub(regex, "", seq) for seq in sequences]
+    # removing the terminal separator with str.replace first leaves the regex without an alternation
+    return [_MOD_STRIP_RE.sub("", seq.replace("-", "")) for seq in sequences]
 
 
 def internal_to_mod_mass(
@@ -249,9 +339,7 @@ def internal_to_mod_mass(
     :param sequences: List[str] of sequences
     :return: List[str] of modified sequences
     """
-    regex = re.compile("(%s)" % "|".join(map(re.escape, MOD_MASSES.keys())))
-    replacement_func = lambda match: f"[+{MOD_MASSES[match.string[match.start():match.end()]]}]"
-    return [regex.sub(replacement_func, seq) for seq in sequences]
+    return _replace_mod_tokens(sequences, _MOD_MASS_STRINGS)
 
 
 def internal_to_mod_names(
@@ -263,44 +351,139 @@ def internal_to_mod_names(
     :param sequences: List[str] of sequences
     :return: List[Tuple[str, str] of mod summary and mod sequences
     """
-    match_list = []
-    pos = [0]
-    offset = [0]
 
     def msp_string_mapper(seq: str):
         """
-        Internal function to create the mod summary and mod_string from given sequence and match_list.
+        Internal function to create the mod summary and mod_string from given sequence.
+
+        Matched internal mods are removed from the sequence and their position in the stripped sequence is stored.
 
         :param seq: The sequence to modify
         :return: Tuple with mod summary and mod_string
         """
-        seq = regex.sub(replace_and_store, seq)
-        mod_string = f"{seq}//{'; '.join([f'{name}@{seq[pos]}{pos}' for name, pos in match_list])}"
-        mod = f"{len(match_list)}"
-        if len(match_list) > 0:
-            mod += f"/{'/'.join([f'{pos},{seq[pos]},{name}' for name, pos in match_list])}"
-        pos[0] = 0
-        offset[0] = 0
-        match_list.clear()
-        return mod, mod_string
-
-    def replace_and_store(match: re.Match) -> str:
-        """
-        Internal function that removes matched internal mods and stores there position in the sequence.
-
-        :param match: an re.Match object found by re.sub
-        :return: empty string
-        """
-        pos[0] = match.start() - 1 - offset[0]
-        offset[0] += match.end() - match.start()
-        match_list.append((MOD_NAMES[match.string[match.start() : match.end()]], pos[0]))
-        return ""
+        parts = []
+        match_list = []
+        last_end = 0
+        offset = 0
+        for match in _MOD_TOKEN_RE.finditer(seq):
+            name = MOD_NAMES.get(match.group())
+            if name is None:
+                continue
+            start, end = match.span()
+            parts.append(seq[last_end:start])
+            match_list.append((name, start - 1 - offset))
+            offset += end - start
+            last_end = end
+        parts.append(seq[last_end:])
+        seq = "".join(parts)
+
+        summary_parts = [f"{len(match_list)}"]
+        mod_string_parts = []
+        for name, pos in match_list:
+            aa = seq[pos]
+            summary_parts.append(f"{pos},{aa},{name}")
+            mod_string_parts.append(f"{name}@{aa}{pos}")
+        return "/".join(summary_parts), f"{seq}//{'; '.join(mod_string_parts)}"
 
-    regex = re.compile("(%s)" % "|".join(map(re.escape, MOD_NAMES.keys())))
     return [msp_string_mapper(seq) for seq in sequences]
 
 
-def parse_modstrings(sequences: List[str], alphabet: Dict[str, int], translate: bool = False, filter: bool = False):
+@lru_cache(maxsize=32)
+def _compile_alphabet_pattern(elements: FrozenSet[str]) -> re.Pattern:
+    """
+    Compile the regex matching all elements of an alphabet, trying longer elements first.
+
+    The pattern only depends on the elements, not on their values, and is cached per unique alphabet.
+
+    :param elements: all possible 'Elements' that can occur in a modstring
+    :return: the compiled regex
+    """
+    pattern = sorted(elements, key=lambda element: (-len(element), element))
+    return re.compile("|".join(map(re.escape, pattern)))
+
+
+def _single_char_lookup_table(alphabet: Mapping[str, int]) -> Optional[np.ndarray]:
+    """
+    Create a table mapping ascii codes to the values of an alphabet that only contains single ascii characters.
+
+    :param alphabet: dictionary where the keys correspond to all possible 'Elements' that can occur in the string
+    :return: lookup table of length 256 with -1 for unknown characters or None, if the alphabet contains elements
+        that are longer than one character or not ascii
+    """
+    if not all(len(element) == 1 and element.isascii() for element in alphabet):
+        return None
+    # the smallest signed dtype holding all values and the -1 for unknown characters keeps the lookups cheap
+    lookup_table = np.full(256, -1, dtype=np.min_scalar_type(-1 - max(alphabet.values(), default=0)))
+    for element, value in alphabet.items():
+        lookup_table[ord(element)] = value
+    return lookup_table
+
+
+def _translate_with_lookup_table(sequence: str, lookup_table: np.ndarray) -> Optional[List[int]]:
+    """
+    Translate a sequence by looking up the ascii codes of all its characters in one go, without a regex.
+
+    :param sequence: the sequence to translate
+    :param lookup_table: lookup table created by _single_char_lookup_table
+    :return: the translated sequence or None, if it contains characters missing in the lookup table
+    """
+    try:
+        translated = lookup_table[np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)]
+    except UnicodeEncodeError:
+        return None
+    if (translated < 0).any():
+        return None
+    return translated.tolist()
+
+
+def _translate_batch_with_lookup_table(sequences: List[str], lookup_table: np.ndarray) -> Optional[List[List[int]]]:
+    """
+    Translate all sequences with a single lookup on their concatenation, avoiding numpy overhead per sequence.
+
+    :param sequences: the sequences to translate
+    :param lookup_table: lookup table created by _single_char_lookup_table
+    :return: the translated sequences or None, if any sequence contains characters missing in the lookup table
+    """
+    translated = _translate_with_lookup_table("".join(sequences), lookup_table)
+    if translated is None:
+        return None
+    ends = np.cumsum([len(sequence) for sequence in sequences]).tolist()
+    return [translated[start:end] for start, end in zip([0] + ends, ends)]
+
+
+def _translate_in_chunks(
+    sequences: Iterable[str], lookup_table: np.ndarray, fallback: Callable[[str], List[int]]
+) -> Iterator[List[int]]:
+    """
+    Lazily translate sequences with one lookup per chunk of _TRANSLATE_CHUNK_SIZE sequences.
+
+    Only the current chunk and its translation are held in memory. A chunk containing characters missing in the
+    lookup table is translated sequence by sequence with fallback instead.
+
+    :param sequences: the sequences to translate
+    :param lookup_table: lookup table created by _single_char_lookup_table
+    :param fallback: function translating a single sequence the lookup table cannot handle
+    :yield: the translated sequences
+    """
+    sequences = iter(sequences)
+    for chunk in iter(lambda: list(islice(sequences, _TRANSLATE_CHUNK_SIZE)), []):
+        translated_chunk = _translate_batch_with_lookup_table(chunk, lookup_table)
+        yield from translated_chunk if translated_chunk is not None else map(fallback, chunk)
+
+
+def _not_parsable_message(sequence: str, split_seq: List[str]) -> str:
+    """
+    Create the error message for a sequence that could not be fully split into elements of an alphabet.
+
+    :param sequence: the sequence that could not be parsed
+    :param split_seq: the elements found in the sequence
+    :return: message naming the elements that could not be parsed
+    """
+    not_parsable_elements = "".join([li[2] for li in difflib.ndiff(sequence, "".join(split_seq)) if li[0] == "-"])
+    return f"The element(s) [{not_parsable_elements}] " f"in the sequence [{sequence}] could not be parsed"
+
+
+def parse_modstrings(sequences: List[str], alphabet: Mapping[str, int], translate: bool = False, filter: bool = False):
     """
     Parse modstrings.
 
@@ -318,26 +501,60 @@ def parse_modstrings(sequences: List[str], alphabet: Dict[str, int], translate:
         split_seq = r_pattern.findall(sequence)
         if "".join(split_seq) == sequence:
             if translate:
-                return [alphabet[aa] for aa in split_seq]
+                return list(map(alphabet.__getitem__, split_seq))
             else:
                 return split_seq
         elif filter:
             return [0]
         else:
-            not_parsable_elements = "".join(
-                [li[2] for li in difflib.ndiff(sequence, "".join(split_seq)) if li[0] == "-"]
-            )
-            raise ValueError(
-                f"The element(s) [{not_parsable_elements}] " f"in the sequence [{sequence}] could not be parsed"
-            )
+            raise ValueError(_not_parsable_message(sequence, split_seq))
 
-    pattern = sorted(alphabet, key=len, reverse=True)
+    def translate_single_chars(sequence: str, r_pattern, table: np.ndarray):
+        # anything the lookup table cannot handle is passed to split_modstring for filtering / error reporting
+        translated = _translate_with_lookup_table(sequence, table)
+        if translated is None:
+            return split_modstring(sequence, r_pattern)
+        return translated
 
-    pattern = [re.escape(i) for i in pattern]
-    regex_pattern = re.compile("|".join(pattern))
+    regex_pattern = _compile_alphabet_pattern(frozenset(alphabet))
+    lookup_table = _single_char_lookup_table(alphabet) if translate else None
+
+    if lookup_table is not None:
+        fallback = partial(translate_single_chars, r_pattern=regex_pattern, table=lookup_table)
+        return _translate_in_chunks(sequences, lookup_table, fallback)
     return map(split_modstring, sequences, repeat(regex_pattern))
 
 
+def parse_and_strip(
+    sequences: List[str], alphabet: Mapping[str, int], filter: bool = False
+) -> Iterator[Tuple[List[int], str]]:
+    """
+    Parse modstrings and remove their mod identifiers in a single pass.
+
+    This combines parse_modstrings with translate=True and internal_without_mods for callers that need both,
+    scanning every sequence only once.
+
+    :param sequences: List of strings
+    :param alphabet: dictionary where the keys correspond to all possible 'Elements' that can occur in the string
+    :param filter: boolean to determine if non-parsable sequences should be filtered out, in which case [0] is
+        yielded as the translated sequence
+    :raises ValueError: if a sequence could not be parsed and filter is False
+    :yield: tuples of the translated sequence 'Elements' and the plain AA sequence
+    """
+    regex_pattern = _compile_alphabet_pattern(frozenset(alphabet))
+    # every element is stripped once up front, so joining the stripped elements yields the plain AA sequence
+    stripped_elements = dict(zip(alphabet, internal_without_mods(list(alphabet))))
+
+    for sequence in sequences:
+        split_seq = regex_pattern.findall(sequence)
+        if "".join(split_seq) == sequence:
+            yield list(map(alphabet.__getitem__, split_seq)), "".join(map(stripped_elements.__getitem__, split_seq))
+        elif filter:
+            yield [0], internal_without_mods([sequence])[0]
+        else:
+            raise ValueError(_not_parsable_message(sequence, split_seq))
+
+
 def add_permutations(modified_sequence: str, unimod_id: int, residues: List[str]):
     """
     Generate different peptide sequences with moving the modification to all possible residues.
@@ -403,12 +620,7 @@ def proteomicsdb_to_internal(sequence: str, mods_variable: str = "", mods_fixed:
         elif len(mod_and_position[1]) == 1:
             sequence = sequence.replace(amino_acid, mods_dict[amino_acid])
 
-    sequence = sequence.replace("m", "M[UNIMOD:35]")
-    sequence = sequence.replace("c", "C[UNIMOD:4]")
-    sequence = sequence.replace("k", "K[UNIMOD:737]")
-    sequence = sequence.replace("s", "S[UNIMOD:21]")
-    sequence = sequence.replace("t", "T[UNIMOD:21]")
-    sequence = sequence.replace("y", "Y[UNIMOD:21]")
+    sequence = sequence.translate(_PROTEOMICSDB_TAGGED_MODS)
 
     sequence = sequence + "-[]"
     if mod_at_start:
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import scipy.sparse
 
 import spectrum_fundamentals.charge as charge
 
@@ -40,3 +41,37 @@ class TestCharge(unittest.TestCase):
         labels = [1, 2, 3]
         classes = 2
         self.assertRaises(ValueError, charge.indices_to_one_hot, labels, classes)
+
+    def test_indices_to_one_hot_with_many_classes(self):
+        """Test indices_to_one_hot with far more classes than labels."""
+        one_hot = charge.indices_to_one_hot([1, 20000], 20000)
+        self.assertEqual((one_hot.shape, one_hot.dtype), ((2, 20000), np.uint8))
+        np.testing.assert_equal(np.nonzero(one_hot), ([0, 1], [0, 19999]))
+
+    def test_indices_to_one_hot_dtype(self):
+        """Test indices_to_one_hot returns a uint8 encoding."""
+        self.assertEqual(charge.indices_to_one_hot([1, 2, 3]).dtype, np.uint8)
+
+    def test_indices_to_one_hot_with_out(self):
+        """Test indices_to_one_hot writes the encoding to a given buffer."""
+        out = np.ones((3, 4), dtype=np.uint8)
+        expected_output = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]])
+        result = charge.indices_to_one_hot([1, 2, 3], 4, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_equal(out, expected_output)
+
+    def test_indices_to_one_hot_with_out_of_wrong_shape(self):
+        """Test indices_to_one_hot correctly raises ValueError if the buffer does not match."""
+        self.assertRaises(ValueError, charge.indices_to_one_hot, [1, 2, 3], 4, np.zeros((2, 4)))
+
+    def test_indices_to_one_hot_with_int(self):
+        """Test indices_to_one_hot with a single integer without classes."""
+        np.testing.assert_equal(charge.indices_to_one_hot(3), np.array([[0, 0, 1]]))
+
+    def test_indices_to_one_hot_sparse(self):
+        """Test indices_to_one_hot with a sparse encoding."""
+        one_hot = charge.indices_to_one_hot([1, 2, 3], 4, sparse=True)
+        expected_output = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]])
+        self.assertIsInstance(one_hot, scipy.sparse.csr_matrix)
+        np.testing.assert_equal(one_hot.toarray(), expected_output)
+        np.testing.assert_equal(charge.indices_to_one_hot(2, sparse=True).toarray(), np.array([[0, 1]]))
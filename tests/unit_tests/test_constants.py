@@ -0,0 +1,64 @@
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+import spectrum_fundamentals.constants as constants
+
+
+class TestLookupTables(unittest.TestCase):
+    """Class to test the read-only lookup tables."""
+
+    def test_tables_are_read_only(self):
+        """Test that the merged lookup tables cannot be modified in place."""
+        for table in [constants.ALPHABET, constants.AA_MASSES, constants.MOD_MASSES, constants.AA_MOD]:
+            with self.assertRaises(TypeError):
+                table["X"] = 0
+
+    def test_derived_table(self):
+        """Test that modified tables can be derived from the read-only tables."""
+        mod_masses = {**constants.MOD_MASSES, "[UNIMOD:999]": 1.0}
+        self.assertEqual(mod_masses["[UNIMOD:999]"], 1.0)
+        self.assertNotIn("[UNIMOD:999]", constants.MOD_MASSES)
+
+    def test_tables_can_be_pickled_and_copied(self):
+        """Test that the read-only tables survive pickling and deep copies, e.g. for multiprocessing workers."""
+        for table in [constants.ALPHABET, constants.AA_MASSES, constants.MOD_MASSES, constants.AA_MOD]:
+            for restored in [pickle.loads(pickle.dumps(table)), copy.deepcopy(table), copy.copy(table)]:
+                self.assertEqual(restored, table)
+                with self.assertRaises(TypeError):
+                    restored["X"] = 0
+
+
+class TestLazyConstants(unittest.TestCase):
+    """Class to test the numpy constants that are built on first access."""
+
+    def test_lazy_constant(self):
+        """Test that lazy constants are listed and built together with the constants of the same builder."""
+        self.assertIn("MASK_DICT_XL", dir(constants))
+        self.assertIs(constants.MASK_DICT[4], constants.B_ION_MASK)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise an AttributeError."""
+        with self.assertRaises(AttributeError):
+            constants.UNKNOWN_CONSTANT
+
+
+class TestAnnotation(unittest.TestCase):
+    """Class to test the fragment annotation arrays."""
+
+    def test_annotation_order(self):
+        """Test that fragments are ordered by position, ion type and charge."""
+        fragment_type, fragment_charge, fragment_number = constants.ANNOTATION
+        self.assertEqual(len(fragment_type), constants.VEC_LENGTH)
+        self.assertEqual(list(fragment_type[:7]), ["y", "y", "y", "b", "b", "b", "y"])
+        self.assertEqual(list(fragment_charge[:7]), [1, 2, 3, 1, 2, 3, 1])
+        self.assertEqual(list(fragment_number[:7]), [1, 1, 1, 1, 1, 1, 2])
+        self.assertEqual(fragment_number[-1], 29)
+        self.assertEqual(fragment_charge.dtype, np.uint8)
+
+    def test_annotation_read_only(self):
+        """Test that the annotation arrays cannot be modified in place."""
+        with self.assertRaises(ValueError):
+            constants.ANNOTATION_FRAGMENT_CHARGE[0] = 2
@@ -2,6 +2,7 @@ import json
 import unittest
 from pathlib import Path
 
+import numpy as np
 from numpy.testing import assert_almost_equal
 
 import spectrum_fundamentals.fragments as fragments
@@ -26,6 +27,18 @@ class TestGetModifications:
         """Test get_modifications."""
         assert fragments._get_modifications("[UNIMOD:2016]-ABC[UNIMOD:4]") == {-2: 304.207146, 2: 57.021464}
 
+    def test_get_modification_masses(self):
+        """Test that the n-terminal modification is added to the modification mass of the first amino acid."""
+        modification_masses, n_term_mod, sequence = fragments._get_modification_masses("[UNIMOD:737]-ABC[UNIMOD:4]")
+        np.testing.assert_array_equal(modification_masses, [229.162932, 0.0, 57.021464])
+        assert (n_term_mod, sequence) == (2, "ABC")
+        assert not modification_masses.flags.writeable
+
+    def test_get_modifications_cached_copy(self):
+        """Test that modifying the result of get_modifications does not modify the cached result."""
+        fragments._get_modifications("ABC[UNIMOD:4]")[0] = 1.0
+        assert fragments._get_modifications("ABC[UNIMOD:4]") == {2: 57.021464}
+
 
 class TestComputeMasses(unittest.TestCase):
     """Class to test compute ion and peptide masses."""
@@ -60,6 +73,30 @@ class TestComputeMasses(unittest.TestCase):
         assert_almost_equal(masses[6], 263.08738, decimal=5)  # y2 DE.-
         self.assertAlmostEqual(masses[9], 187.07133 + 304.207146, places=5)  # b2: -.AD
 
+    def test_compute_ion_masses_without_padding(self):
+        """Test compute ion masses of a sequence of full length given as list and as array."""
+        seq_int = [1, 3, 4] * 10
+        masses = fragments.compute_ion_masses(seq_int, [1, 0, 0, 0, 0, 0])
+        b29 = (
+            fragments.prefix_masses(seq_int)[28]
+            + fragments.constants.PARTICLE_MASSES["PROTON"]
+            + fragments.constants.MASSES["N_TERMINUS"]
+            - fragments.constants.ATOM_MASSES["H"]
+        )
+        assert_almost_equal(masses[-3], b29, decimal=3)  # b29: the last b ion is only computed without padding
+        np.testing.assert_array_equal(masses, fragments.compute_ion_masses(np.array(seq_int), [1, 0, 0, 0, 0, 0]))
+
+    def test_compute_ion_masses_batch(self):
+        """Test that batch ion masses match compute_ion_masses for every sequence."""
+        seq_int = [[1, 3, 4] + [0] * 27, [24, 9, 11, 5, 16] + [0] * 25]  # peptides = ADE, CKMFS
+        masses = fragments.compute_ion_masses_batch(seq_int, [1, 3], "tmtpro")
+        np.testing.assert_array_equal(masses[0], fragments.compute_ion_masses(seq_int[0], [1, 0, 0, 0, 0, 0], "tmtpro"))
+        np.testing.assert_array_equal(masses[1], fragments.compute_ion_masses(seq_int[1], [0, 0, 1, 0, 0, 0], "tmtpro"))
+
+    def test_compute_ion_masses_batch_with_invalid_length(self):
+        """Negative testing of batch ion masses with sequences that are too short."""
+        self.assertRaises(ValueError, fragments.compute_ion_masses_batch, [[1, 3, 4]], [1])
+
     def test_compute_peptide_masses(self):
         """Test computation of peptide masses with valid input."""
         seq = "SEQUENC[UNIMOD:4]E"
@@ -70,6 +107,11 @@ class TestComputeMasses(unittest.TestCase):
         seq = "[UNIMOD:737]-SEQUENC[UNIMOD:4]E"
         self.assertEqual(fragments.compute_peptide_mass(seq), 1274.41908767)
 
+    def test_compute_peptide_masses_unmodified_termini(self):
+        """Test computation of peptide masses with explicitly unmodified termini."""
+        seq = "[]-SEQUENC[UNIMOD:4]E-[]"
+        self.assertEqual(fragments.compute_peptide_mass(seq), 1045.2561556699998)
+
     def test_compute_peptide_masses_with_invalid_syntax(self):
         """Negative testing of comuptation of peptide mass with unsupported syntax of mod string."""
         seq = "SEQUEM(Ox.)CE"
@@ -80,6 +122,39 @@ class TestComputeMasses(unittest.TestCase):
         seq = "SEQUENC[UNIMOD:0]E"
         self.assertRaises(KeyError, fragments.compute_peptide_mass, seq)
 
+    def test_prefix_masses(self):
+        """Test cumulative residue masses of an integer encoded sequence with padding."""
+        masses = fragments.prefix_masses([1, 3, 4, 0, 0])  # peptide = ADE
+        assert_almost_equal(masses, [71.037114, 186.064057, 315.10665, 315.10665, 315.10665], decimal=6)
+
+    def test_prefix_masses_matches_ion_masses(self):
+        """Test that b ions can be computed from prefix masses."""
+        seq_int = [1, 3, 4] + [0] * 27
+        b_ions = (
+            fragments.prefix_masses(seq_int)[:2]
+            + fragments.constants.PARTICLE_MASSES["PROTON"]
+            + fragments.constants.MASSES["N_TERMINUS"]
+            - fragments.constants.ATOM_MASSES["H"]
+        )
+        masses = fragments.compute_ion_masses(seq_int, [1, 0, 0, 0, 0, 0])
+        assert_almost_equal(b_ions, masses[[3, 9]], decimal=4)
+
+    def test_prefix_masses_y_ions_with_padding(self):
+        """Test that y ions can be computed from prefix masses of a padded sequence."""
+        seq_int = [1, 3, 4] + [0] * 27  # peptide = ADE
+        prefix = fragments.prefix_masses(seq_int)
+        length = 3
+        y_residues = prefix[length - 1] - prefix[[length - 2, length - 3]]
+        assert_almost_equal(y_residues, [129.042593, 244.069536], decimal=6)
+        y_ions = (
+            y_residues
+            + fragments.constants.PARTICLE_MASSES["PROTON"]
+            + fragments.constants.MASSES["C_TERMINUS"]
+            + fragments.constants.ATOM_MASSES["H"]
+        )
+        masses = fragments.compute_ion_masses(seq_int, [1, 0, 0, 0, 0, 0])
+        assert_almost_equal(y_ions, masses[[0, 6]], decimal=4)
+
 
 class TestMassTolerances(unittest.TestCase):
     """Testing the mass tolerance calculations in various scenarios."""
@@ -108,6 +183,17 @@ class TestMassTolerances(unittest.TestCase):
         self.assertEqual(window_tof, (9.9996, 10.0004))
         self.assertEqual(window_itms, (9.65, 10.35))
 
+    def test_mass_tol_batch(self):
+        """Test that get_min_max_mass_batch matches get_min_max_mass for every mass."""
+        masses = np.array([10.0, 250.5, 1000.25])
+        min_masses, max_masses = fragments.get_min_max_mass_batch("TOF", masses)
+        for mass, min_mass, max_mass in zip(masses, min_masses, max_masses):
+            self.assertEqual(fragments.get_min_max_mass("TOF", mass), (min_mass, max_mass))
+
+    def test_mass_tol_with_invalid_unit(self):
+        """Negative testing of get_min_max_mass_batch with an unsupported unit."""
+        self.assertRaises(ValueError, fragments.get_min_max_mass_batch, "FTMS", np.array([10.0]), 15, "mmu")
+
 
 class TestInitializePeaks(unittest.TestCase):
     """Class to test initialize_peaks function."""
@@ -131,6 +217,49 @@ class TestInitializePeaks(unittest.TestCase):
         self.assertEqual(actual_peptide_sequence, expected_peptide_sequence)
         assert_almost_equal(actual_calc_mass_s, expected_mass_s, decimal=5)
 
+    def test_initialize_peak_columns(self):
+        """Test that the peak columns are sorted by mass and hold the same peaks as initialize_peaks."""
+        fragment_columns, _, _, _ = fragments._initialize_peak_columns("AC[UNIMOD:4]DEK", "FTMS", 3)
+        list_out, _, _, _ = fragments.initialize_peaks("AC[UNIMOD:4]DEK", "FTMS", 3)
+
+        self.assertTrue(np.all(np.diff(fragment_columns["mass"]) >= 0))
+        self.assertEqual({len(column) for column in fragment_columns.values()}, {30})
+        self.assertEqual(fragments._to_records(fragment_columns), list_out)
+
+    def test_initialize_peaks_batch(self):
+        """Test that the batch gives the same peaks as initialize_peaks for each sequence."""
+        sequences = ["AAAA", "[UNIMOD:737]-PEPC[UNIMOD:4]TIDEK", "M[UNIMOD:35]K"]
+        charges = [3, 2, 1]
+        results = fragments.initialize_peaks_batch(sequences, "FTMS", charges, 15, "ppm")
+        self.assertEqual(len(results), 3)
+        for sequence, charge, result in zip(sequences, charges, results):
+            self.assertEqual(result, fragments.initialize_peaks(sequence, "FTMS", charge, 15, "ppm"))
+
+    def test_initialize_peaks_batch_with_invalid_charges(self):
+        """Negative testing of initialize_peaks_batch with a charge missing."""
+        self.assertRaises(ValueError, fragments.initialize_peaks_batch, ["AAAA", "KK"], "FTMS", [2])
+
+    def test_fragment_layout_cached(self):
+        """Test that the fragment layout is built once per peptide length and cannot be modified."""
+        layout = fragments._fragment_layout(5, 2)
+        self.assertIs(fragments._fragment_layout(5, 2), layout)
+        _, _, ion_type_ids, numbers, fragment_charges = layout
+        self.assertEqual(list(numbers[:5]), [1, 1, 1, 1, 2])
+        self.assertEqual(list(fragment_charges[:5]), [1, 1, 2, 2, 1])
+        with self.assertRaises(ValueError):
+            ion_type_ids[0] = 1
+
+    def test_initialize_peak_columns_xl_variants(self):
+        """Test that only the fragments containing the crosslinker are generated for the long variant."""
+        fragment_columns, tmt_n_term, peptide_sequence = fragments._initialize_peak_columns_xl_variants(
+            "PEK[UNIMOD:1881]TIDE", "PEK[UNIMOD:1882]TIDE", 3, "FTMS", 2
+        )
+        ion_types = list(fragments._ION_TYPE_LABELS[fragment_columns["ion_type"]])
+        self.assertEqual((tmt_n_term, peptide_sequence), (1, "PEKTIDE"))
+        self.assertEqual(ion_types.count("b"), 4)  # b1, b2 with charge 1 and 2
+        self.assertEqual(ion_types.count("b-short"), ion_types.count("b-long"))
+        self.assertEqual(len(ion_types), 4 + 10 + 10 + 8 + 6 + 6)  # b, b-short, b-long, y, y-short, y-long
+
     def test_initialize_peaks_non_cl_xl(self):
         """Test initialize_peaks_xl with basic input for non-cleavable crosslinked peptides."""
         initialize_peaks_xl_input = {
@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spectrum_fundamentals.metrics.metric import Metric
+
+
+class TestWriteToFile(unittest.TestCase):
+    """Class to test writing the metrics to a file."""
+
+    def setUp(self):
+        """Create a metric with some values."""
+        self.metric = Metric()
+        self.metric.metrics_val = pd.DataFrame({"spectral_angle": [0.5, 0.25], "matched_peaks": [3, 1]})
+
+    def test_write_tsv(self):
+        """Test that the metrics are written tab separated without the index."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "metrics.tab"
+            self.metric.write_to_file(file_path)
+            self.assertEqual(file_path.read_text(), "spectral_angle\tmatched_peaks\n0.5\t3\n0.25\t1\n")
+
+    def test_write_unsupported_format(self):
+        """Negative testing of writing the metrics with an unsupported file format."""
+        self.assertRaises(ValueError, self.metric.write_to_file, "metrics.xlsx", "xlsx")
+
+    def test_write_parquet(self):
+        """Test that the metrics written to parquet are read back unchanged."""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "metrics.parquet"
+            self.metric.write_to_file(file_path)
+            pd.testing.assert_frame_equal(pd.read_parquet(file_path), self.metric.metrics_val)
+
+    def test_write_feather(self):
+        """Test that the metrics written to feather are read back unchanged."""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "metrics.feather"
+            self.metric.write_to_file(file_path)
+            pd.testing.assert_frame_equal(pd.read_feather(file_path), self.metric.metrics_val)
@@ -1,7 +1,8 @@
+import itertools
 import unittest
 
 import spectrum_fundamentals.mod_string as mod
-from spectrum_fundamentals.constants import ALPHABET
+from spectrum_fundamentals.constants import AA_ALPHABET, ALPHABET
 
 
 class TestMSP:
@@ -110,6 +111,12 @@ class TestMaxQuantToInternal(unittest.TestCase):
             mod.maxquant_to_internal(["_ABCDEFGHK_"], fixed_mods), ["[UNIMOD:737]-ABC[UNIMOD:4]DEFGHK[UNIMOD:737]"]
         )
 
+    def test_maxquant_to_internal_variable_tmt_n_term(self):
+        """Test maxquant_to_internal with variable n-terminal tmt."""
+        self.assertEqual(
+            mod.maxquant_to_internal(["_(tm)ABCDEFGHK(tm)_"]), ["[UNIMOD:737]-ABC[UNIMOD:4]DEFGHK[UNIMOD:737]"]
+        )
+
     def test_maxquant_to_internal_silac(self):
         """Test maxquant_to_internal_silac."""
         fixed_mods = {"C": "C[UNIMOD:4]", "K": "K[UNIMOD:259]", "R": "R[UNIMOD:267]"}
@@ -173,6 +180,12 @@ class TestInternalTransformations(unittest.TestCase):
             ["[+229.162932]-ABC[+57.021464]DEFGHK[+229.162932]"],
         )
 
+    def test_malformed_sequence_does_not_affect_batch(self):
+        """Test that an unclosed bracket does not prevent the translation of the following sequence."""
+        sequences = ["A[", "C[UNIMOD:4]K[UNIMOD:737]"]
+        self.assertEqual(mod.internal_to_spectronaut(sequences), ["A[", "C[Carbamidomethyl (C)]K[TMT_6]"])
+        self.assertEqual(mod.internal_to_mod_mass(sequences), ["A[", "C[+57.021464]K[+229.162932]"])
+
     def test_proteomicsdb_to_internal(self):
         """Test proteomicsdb sequence to internal sequence with fixed and variable modifications."""
         prdb_sequence = "AAMCGHK"
@@ -224,6 +237,25 @@ class TestParsing(unittest.TestCase):
         values = [ALPHABET[elem] for elem in valid_seq]
         self.assertEqual(next(mod.parse_modstrings(["".join(valid_seq)], alphabet=ALPHABET, translate=True)), values)
 
+    def test_parse_modstrings_with_translation_single_char_alphabet(self):
+        """Test parse_modstrings with translation of an alphabet only containing single characters."""
+        valid_seq = "ACDEFGHIKLMNPQRSTVWY"
+        values = [AA_ALPHABET[elem] for elem in valid_seq]
+        parsed = mod.parse_modstrings([valid_seq, "ACX"], alphabet=AA_ALPHABET, translate=True, filter=True)
+        self.assertEqual(list(parsed), [values, [0]])
+
+    def test_parse_modstrings_with_translation_single_char_alphabet_batch(self):
+        """Test parse_modstrings with translation of multiple valid sequences of single characters."""
+        sequences = ["ACDE", "", "KR"]
+        values = [[AA_ALPHABET[elem] for elem in seq] for seq in sequences]
+        self.assertEqual(list(mod.parse_modstrings(sequences, alphabet=AA_ALPHABET, translate=True)), values)
+
+    def test_parse_modstrings_with_translation_single_char_alphabet_lazy(self):
+        """Test that the single character translation only consumes the sequences it needs."""
+        parsed = mod.parse_modstrings(itertools.cycle(["ACDE", "KR"]), alphabet=AA_ALPHABET, translate=True)
+        values = [[AA_ALPHABET[elem] for elem in seq] for seq in ["ACDE", "KR", "ACDE"]]
+        self.assertEqual(list(itertools.islice(parsed, 3)), values)
+
     def test_parse_modstrings_invalid(self):
         """Test correct behaviour of  parse_modstrings when invalid sequence is encountered."""
         invalid_seq = "SEQUENCE"
@@ -234,3 +266,14 @@ class TestParsing(unittest.TestCase):
         """Test correct behaviour of parse_modstrings when invalid sequence is handled."""
         invalid_seq = "testing"
         self.assertEqual(next(mod.parse_modstrings([invalid_seq], alphabet=ALPHABET, filter=True)), [0])
+
+    def test_parse_and_strip(self):
+        """Test parse_and_strip returns the translated and the plain sequence."""
+        sequence = "[UNIMOD:1]-AC[UNIMOD:4]DM[UNIMOD:35]K"
+        expected_translation = next(mod.parse_modstrings([sequence], alphabet=ALPHABET, translate=True))
+        self.assertEqual(list(mod.parse_and_strip([sequence], alphabet=ALPHABET)), [(expected_translation, "ACDMK")])
+
+    def test_parse_and_strip_invalid(self):
+        """Test correct behaviour of parse_and_strip when invalid sequences are encountered."""
+        self.assertRaises(ValueError, list, mod.parse_and_strip(["SEQUENCE"], alphabet=ALPHABET))
+        self.assertEqual(list(mod.parse_and_strip(["testing"], alphabet=ALPHABET, filter=True)), [([0], "testing")])